@@ -0,0 +1,170 @@
+"""
+Persistent storage for bank account transactions.
+
+The Week 3 BankAccount keeps every transaction in an in-memory list, and
+the only way to rebuild a balance is to replay all of them. Here:
+
+- TransactionLog appends fixed-width binary records (struct) to a file,
+  buffering them and writing in batches.
+- PersistentBankAccount has the same deposit/withdraw/get_balance API as
+  BankAccount, but records transactions in a TransactionLog and writes
+  a balance snapshot every `snapshot_every` transactions.
+- Reopening an account reads the latest snapshot and replays only the
+  log records written after it, so recovery time depends on the snapshot
+  interval, not on the total history.
+
+Files used for an account stored at `path`:
+    path          the transaction log
+    path + ".snap"  the snapshots, also fixed-width and append-only
+"""
+
+import os
+import struct
+
+DEPOSIT = 1
+WITHDRAW = 2
+KIND_NAMES = {DEPOSIT: "deposit", WITHDRAW: "withdraw"}
+
+# Log record: kind, amount
+RECORD = struct.Struct("<Bd")
+# Snapshot record: number of log records covered, balance after them
+SNAPSHOT = struct.Struct("<Qd")
+
+BATCH_SIZE = 4096
+SNAPSHOT_EVERY = 100_000
+
+
+def _whole_records(path, record_size):
+    """Number of complete records in a file, dropping a torn final write."""
+    if not os.path.exists(path):
+        return 0
+    size = os.path.getsize(path)
+    count = size // record_size
+    if size != count * record_size:
+        with open(path, "r+b") as f:
+            f.truncate(count * record_size)
+    return count
+
+
+class TransactionLog:
+    """Append-only file of (kind, amount) records, written in batches."""
+
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._durable = _whole_records(path, RECORD.size)
+        self._pending = []
+        self._file = open(path, "ab")
+
+    def __len__(self):
+        return self._durable + len(self._pending)
+
+    def append(self, kind, amount):
+        self._pending.append(RECORD.pack(kind, amount))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self._file.write(b"".join(self._pending))
+            self._durable += len(self._pending)
+            self._pending.clear()
+        self._file.flush()
+
+    def records(self, start=0):
+        """Yield (kind, amount) pairs from record number `start` onwards."""
+        self.flush()
+        with open(self.path, "rb") as f:
+            f.seek(start * RECORD.size)
+            while True:
+                block = f.read(RECORD.size * self.batch_size)
+                if not block:
+                    return
+                yield from RECORD.iter_unpack(block)
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class PersistentBankAccount:
+    """A BankAccount whose history lives in a TransactionLog on disk."""
+
+    def __init__(self, owner, path, balance=0.0, snapshot_every=SNAPSHOT_EVERY, batch_size=BATCH_SIZE):
+        self.owner = owner
+        self.snapshot_every = snapshot_every
+        self._snapshot_path = path + ".snap"
+        self._log = TransactionLog(path, batch_size)
+
+        if len(self._log) == 0 and _whole_records(self._snapshot_path, SNAPSHOT.size) == 0:
+            # New account - the opening balance is snapshot zero
+            self.__balance = balance
+            self.snapshot()
+        else:
+            self.__balance = self._recover()
+
+    def _recover(self):
+        """Latest snapshot plus the log records written after it."""
+        snapshots = _whole_records(self._snapshot_path, SNAPSHOT.size)
+        covered, balance = 0, 0.0
+        if snapshots:
+            with open(self._snapshot_path, "rb") as f:
+                f.seek((snapshots - 1) * SNAPSHOT.size)
+                covered, balance = SNAPSHOT.unpack(f.read(SNAPSHOT.size))
+        covered = min(covered, len(self._log))
+        self._last_snapshot = covered
+        for kind, amount in self._log.records(covered):
+            if kind == DEPOSIT:
+                balance += amount
+            else:
+                balance -= amount
+        return balance
+
+    def deposit(self, amount: float):
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive")
+        self.__balance += amount
+        self._record(DEPOSIT, amount)
+        return self.__balance
+
+    def withdraw(self, amount: float):
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive")
+        if amount > self.__balance:
+            raise ValueError("Insufficient funds")
+        self.__balance -= amount
+        self._record(WITHDRAW, amount)
+        return self.__balance
+
+    def get_balance(self):
+        return self.__balance
+
+    def _record(self, kind, amount):
+        self._log.append(kind, amount)
+        if len(self._log) - self._last_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self):
+        """Flush the log and store the current balance."""
+        self._log.flush()
+        with open(self._snapshot_path, "ab") as f:
+            f.write(SNAPSHOT.pack(len(self._log), self.__balance))
+        self._last_snapshot = len(self._log)
+
+    def transactions(self, start=0):
+        """Yield ("deposit" / "withdraw", amount) like BankAccount._transactions."""
+        for kind, amount in self._log.records(start):
+            yield KIND_NAMES[kind], amount
+
+    def transaction_count(self):
+        return len(self._log)
+
+    def close(self):
+        self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,179 @@
+"""
+AccountManager - many bank accounts in compact, indexed storage.
+
+This is the Week 3 homework's AccountManager sized for millions of
+accounts:
+
+- balances live in one array('d') column (8 bytes per account) instead of
+  a private __balance attribute on each BankAccount object
+- a dict maps account ID -> row for O(1) lookups, and a second dict maps
+  owner -> list of account IDs
+- deposit_many / withdraw_many check a whole batch at once (vectorized
+  with NumPy when it is installed) and apply it all-or-nothing: if any
+  entry is invalid, nothing changes and ValueError is raised
+
+Every method takes the same amounts with or without NumPy: real numbers
+(not bools or strings, which raise TypeError) that are positive and
+finite (anything else raises ValueError).
+"""
+
+import math
+import numbers
+from array import array
+
+# NumPy is optional - bulk operations fall back to plain loops without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _check_amount(amount, message):
+    """Raise unless amount is a positive, finite real number."""
+    if isinstance(amount, bool) or not isinstance(amount, numbers.Real):
+        raise TypeError(f"Amount must be a number, not {type(amount).__name__}")
+    if not 0 < amount < math.inf:
+        raise ValueError(message)
+
+
+def _check_amounts(amounts, message):
+    """A float64 array of amounts, checked like _check_amount() in one pass."""
+    amounts = np.asarray(amounts)
+    if amounts.dtype.kind not in "iuf":
+        raise TypeError(f"Amounts must be numbers, not {amounts.dtype}")
+    if not ((amounts > 0) & np.isfinite(amounts)).all():
+        raise ValueError(message)
+    return amounts.astype(np.float64, copy=False)
+
+
+class AccountManager:
+    """Keeps many accounts; single-account methods match BankAccount's errors."""
+
+    def __init__(self):
+        self._balances = array("d")
+        self._owners = []
+        self._rows = {}             # account ID -> row in _balances
+        self._by_owner = {}         # owner -> [account IDs]
+        self._next_id = 1
+
+    def __len__(self):
+        return len(self._balances)
+
+    def __contains__(self, account_id):
+        return account_id in self._rows
+
+    def _row(self, account_id):
+        try:
+            return self._rows[account_id]
+        except KeyError:
+            raise KeyError(f"Unknown account {account_id!r}") from None
+
+    def open_account(self, owner, balance=0.0, account_id=None):
+        """Create an account and return its ID (auto-numbered unless given)."""
+        if not 0 <= balance < math.inf:
+            raise ValueError("Opening balance cannot be negative")
+        if account_id is None:
+            account_id = self._next_id
+            while account_id in self._rows:
+                account_id += 1
+            self._next_id = account_id + 1
+        elif account_id in self._rows:
+            raise ValueError(f"Account {account_id!r} already exists")
+        self._rows[account_id] = len(self._balances)
+        self._balances.append(balance)
+        self._owners.append(owner)
+        self._by_owner.setdefault(owner, []).append(account_id)
+        return account_id
+
+    def owner(self, account_id):
+        return self._owners[self._row(account_id)]
+
+    def accounts_for(self, owner):
+        """IDs of every account held by owner."""
+        return list(self._by_owner.get(owner, ()))
+
+    def get_balance(self, account_id):
+        return self._balances[self._row(account_id)]
+
+    def total_for(self, owner):
+        balances = self._balances
+        rows = self._rows
+        return sum(balances[rows[account_id]] for account_id in self._by_owner.get(owner, ()))
+
+    def deposit(self, account_id, amount: float):
+        _check_amount(amount, "Deposit amount must be positive")
+        row = self._row(account_id)
+        self._balances[row] += amount
+        return self._balances[row]
+
+    def withdraw(self, account_id, amount: float):
+        _check_amount(amount, "Withdrawal amount must be positive")
+        row = self._row(account_id)
+        if amount > self._balances[row]:
+            raise ValueError("Insufficient funds")
+        self._balances[row] -= amount
+        return self._balances[row]
+
+    # ---------- bulk operations ----------
+
+    def _batch_rows(self, account_ids, amounts):
+        rows = self._rows
+        try:
+            batch_rows = [rows[account_id] for account_id in account_ids]
+        except KeyError as e:
+            raise KeyError(f"Unknown account {e.args[0]!r}") from None
+        if len(batch_rows) != len(amounts):
+            raise ValueError("account_ids and amounts must be the same length")
+        return batch_rows
+
+    def deposit_many(self, account_ids, amounts):
+        """Deposit amounts[i] into account_ids[i] for every i, or into none."""
+        rows = self._batch_rows(account_ids, amounts)
+        if np is None:
+            for amount in amounts:
+                _check_amount(amount, "Deposit amount must be positive")
+            for row, amount in zip(rows, amounts):
+                self._balances[row] += amount
+            return
+
+        rows = np.asarray(rows, dtype=np.intp)
+        amounts = _check_amounts(amounts, "Deposit amount must be positive")
+        np.add.at(np.frombuffer(self._balances, dtype=np.float64), rows, amounts)
+
+    def _gather(self, rows):
+        """Copies of the balances at rows (a NumPy index array)."""
+        view = np.frombuffer(self._balances, dtype=np.float64)
+        values = view[rows]
+        del view
+        return values
+
+    def withdraw_many(self, account_ids, amounts):
+        """Withdraw amounts[i] from account_ids[i] for every i, or from none.
+
+        An account that appears several times must cover the sum of its
+        withdrawals.
+        """
+        rows = self._batch_rows(account_ids, amounts)
+        if np is None:
+            for amount in amounts:
+                _check_amount(amount, "Withdrawal amount must be positive")
+            totals = {}
+            for row, amount in zip(rows, amounts):
+                totals[row] = totals.get(row, 0.0) + amount
+            if any(total > self._balances[row] for row, total in totals.items()):
+                raise ValueError("Insufficient funds")
+            for row, amount in zip(rows, amounts):
+                self._balances[row] -= amount
+            return
+
+        rows = np.asarray(rows, dtype=np.intp)
+        amounts = _check_amounts(amounts, "Withdrawal amount must be positive")
+        touched, position = np.unique(rows, return_inverse=True)
+        totals = np.bincount(position, weights=amounts)
+        # Check against gathered copies: a live frombuffer view kept by the
+        # exception's traceback would stop open_account() resizing the array
+        if (totals > self._gather(touched)).any():
+            raise ValueError("Insufficient funds")
+        balances = np.frombuffer(self._balances, dtype=np.float64)
+        np.subtract.at(balances, rows, amounts)
+        del balances
@@ -0,0 +1,85 @@
+"""
+Benchmark: AccountManager bulk operations vs per-object BankAccount loops.
+
+Run from the repository root:
+    python benchmarks/bench_account_manager.py [accounts] [batch]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from account_manager import AccountManager
+from week3_data_structures_oop import BankAccount
+
+
+def timed(label, func, count):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<36} {elapsed:.3f}s ({count / elapsed:,.0f}/s)")
+
+
+def build_naive(accounts):
+    return {i: BankAccount(f"owner{i % 1000}", 100.0) for i in range(1, accounts + 1)}
+
+
+def build_manager(accounts):
+    manager = AccountManager()
+    for i in range(1, accounts + 1):
+        manager.open_account(f"owner{i % 1000}", 100.0)
+    return manager
+
+
+def memory(build, accounts):
+    tracemalloc.start()
+    result = build(accounts)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, used
+
+
+def main():
+    accounts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    rng = random.Random(5)
+    ids = [rng.randint(1, accounts) for _ in range(batch)]
+    amounts = [round(rng.uniform(0.01, 5.0), 2) for _ in range(batch)]
+
+    naive, naive_bytes = memory(build_naive, accounts)
+    manager, manager_bytes = memory(build_manager, accounts)
+    print(f"{accounts:,} accounts: BankAccount objects {naive_bytes / accounts:.0f} B/account, "
+          f"AccountManager {manager_bytes / accounts:.0f} B/account")
+
+    print(f"Batch of {batch:,} operations:")
+
+    def naive_deposits():
+        for account_id, amount in zip(ids, amounts):
+            naive[account_id].deposit(amount)
+
+    def naive_withdrawals():
+        # All-or-nothing by hand: check everything first, then apply
+        totals = {}
+        for account_id, amount in zip(ids, amounts):
+            totals[account_id] = totals.get(account_id, 0.0) + amount
+        if any(total > naive[account_id].get_balance() for account_id, total in totals.items()):
+            raise ValueError("Insufficient funds")
+        for account_id, amount in zip(ids, amounts):
+            naive[account_id].withdraw(amount)
+
+    timed("BankAccount.deposit loop", naive_deposits, batch)
+    timed("AccountManager.deposit_many", lambda: manager.deposit_many(ids, amounts), batch)
+    timed("BankAccount check + withdraw loop", naive_withdrawals, batch)
+    timed("AccountManager.withdraw_many", lambda: manager.withdraw_many(ids, amounts), batch)
+
+    sample = rng.sample(range(1, accounts + 1), 1000)
+    drift = max(abs(naive[i].get_balance() - manager.get_balance(i)) for i in sample)
+    print(f"Largest balance difference on 1,000 sampled accounts: {drift:.2e}")
+
+
+if __name__ == "__main__":
+    main()
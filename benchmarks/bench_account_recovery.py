@@ -0,0 +1,62 @@
+"""
+Benchmark: restoring a PersistentBankAccount from snapshot + log tail vs
+replaying its whole transaction log.
+
+The default count leaves SNAPSHOT_EVERY - 1 transactions after the last
+snapshot, so the restore times the longest possible tail replay.
+
+Run from the repository root:
+    python benchmarks/bench_account_recovery.py [transactions]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from account_log import DEPOSIT, SNAPSHOT_EVERY, PersistentBankAccount, TransactionLog
+
+
+def main():
+    # A multiple of SNAPSHOT_EVERY would leave an empty tail - the best case
+    transactions = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000 + SNAPSHOT_EVERY - 1
+    directory = tempfile.mkdtemp(prefix="accounts-")
+    path = os.path.join(directory, "alice.log")
+    try:
+        start = time.perf_counter()
+        with PersistentBankAccount("Alice", path, 100.0) as account:
+            for i in range(transactions):
+                if i % 3 == 2:
+                    account.withdraw(1.25)
+                else:
+                    account.deposit(1.0)
+            expected = account.get_balance()
+        write_time = time.perf_counter() - start
+        print(f"Wrote {transactions:,} transactions in {write_time:.2f}s "
+              f"({transactions / write_time:,.0f}/s), log size {os.path.getsize(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        with PersistentBankAccount("Alice", path) as account:
+            restored = account.get_balance()
+        restore_time = time.perf_counter() - start
+        print(f"Snapshot + tail restore:  {restore_time * 1000:9.2f} ms  balance {restored} "
+              f"(matches: {restored == expected}, tail of {transactions % SNAPSHOT_EVERY:,} transactions)")
+
+        start = time.perf_counter()
+        log = TransactionLog(path)
+        balance = 100.0
+        for kind, amount in log.records():
+            balance = balance + amount if kind == DEPOSIT else balance - amount
+        log.close()
+        replay_time = time.perf_counter() - start
+        print(f"Full replay:              {replay_time * 1000:9.2f} ms  balance {balance} "
+              f"(matches: {balance == expected})")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark: memory per citizen for Citizen objects vs CompactCitizen vs CitizenTable.
+
+Run from the repository root:
+    python benchmarks/bench_citizen_memory.py [rows]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assignment1 import Citizen, CitizenTable, CompactCitizen
+
+
+def measure(build, names, incomes):
+    """Return bytes allocated by build(), not counting the name strings."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(names, incomes)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    names = [f"Citizen {i}" for i in range(rows)]
+    incomes = [float(i % 20000) for i in range(rows)]
+    name_bytes = sum(len(name.encode("utf-8")) for name in names)
+
+    plain, _ = measure(lambda n, inc: [Citizen(a, b) for a, b in zip(n, inc)], names, incomes)
+    slotted, _ = measure(lambda n, inc: [CompactCitizen(a, b) for a, b in zip(n, inc)], names, incomes)
+    table_bytes, table = measure(lambda n, inc: CitizenTable(zip(n, inc)), names, incomes)
+
+    print(f"Citizens:               {rows:,}")
+    print(f"Citizen list:           {plain / rows:7.1f} bytes/citizen (plus shared name strings)")
+    print(f"CompactCitizen list:    {slotted / rows:7.1f} bytes/citizen (plus shared name strings)")
+    print(f"CitizenTable:           {(table_bytes - name_bytes) / rows:7.1f} bytes/citizen "
+          f"excluding {name_bytes / rows:.1f} name bytes")
+    print(f"CitizenTable columns:   {(table.nbytes() - name_bytes) / rows:7.1f} bytes/citizen (exact)")
+
+
+if __name__ == "__main__":
+    main()
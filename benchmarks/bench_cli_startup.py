@@ -0,0 +1,50 @@
+"""
+Benchmark: start-up time of `uncommon.py --help` with lazy vs eager imports.
+
+uncommon.py imports a subcommand's module only when that subcommand
+runs. The eager case imports every registered module up front, as a
+runner with top-level imports would, then prints the same help.
+
+Run from the repository root:
+    python benchmarks/bench_cli_startup.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from uncommon import COMMANDS
+
+REPEATS = 21
+
+# The module each subcommand's handler imports
+MODULES = ["assignment1", "grading", "text_analysis", "passwords", "fibonacci"]
+
+CASES = [
+    ("python -c pass", ["-c", "pass"]),
+    ("uncommon.py --help (lazy)", ["uncommon.py", "--help"]),
+    ("uncommon.py --help (eager)", ["-c", f"import {', '.join(MODULES)}, uncommon; uncommon.main(['--help'])"]),
+]
+
+
+def wall_ms(args):
+    start = time.perf_counter()
+    subprocess.run([sys.executable] + args, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(f"{len(COMMANDS)} subcommands registered; median of {REPEATS} runs")
+    for label, args in CASES:
+        wall_ms(args)  # warm the bytecode cache
+        times = [wall_ms(args) for _ in range(REPEATS)]
+        print(f"{label:<28} {statistics.median(times):7.1f} ms  (min {min(times):.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
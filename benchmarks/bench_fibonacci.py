@@ -0,0 +1,49 @@
+"""
+Benchmark: fast-doubling fib(n) vs repeated addition at n = 10^3, 10^5, 10^6.
+
+Run from the repository root:
+    python benchmarks/bench_fibonacci.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fibonacci import cached_fib, fib, fibonacci_numbers
+from lesson_functions import load_lesson_function
+
+fibonacci_iterative = load_lesson_function("week2_control_flow_functions.py", "fibonacci_iterative")
+
+
+def fib_by_addition(n):
+    """The n-th term by the same repeated addition fibonacci_iterative() uses."""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    assert list(fibonacci_numbers(100)) == fibonacci_iterative(100)
+    assert all(fib(n) == fib_by_addition(n) for n in range(500))
+
+    for n in (10 ** 3, 10 ** 5, 10 ** 6):
+        fast, fast_time = timed(fib, n)
+        slow, slow_time = timed(fib_by_addition, n)
+        cached_fib(n)
+        _, hit_time = timed(cached_fib, n)
+        print(f"n = {n:>9,}: {fast.bit_length():>7,} bits | fast doubling {fast_time * 1000:9.3f} ms | "
+              f"addition {slow_time * 1000:10.3f} ms ({slow_time / fast_time:,.0f}x) | "
+              f"memo hit {hit_time * 1e6:.1f} us | equal: {fast == slow}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: top-k after every batch - FrequencyIndex vs Counter.most_common.
+
+Streams Zipf-distributed words (100M tokens by default) in batches. After
+each batch the baseline runs Counter.update + most_common(k), as in the
+Week 3 example. The exact and approximate FrequencyIndex modes take the
+same batches. Only the counting and top-k work is timed, not generating
+the words.
+
+Run from the repository root:
+    python benchmarks/bench_frequency_index.py [tokens] [batch_size] [vocabulary]
+"""
+
+import os
+import random
+import sys
+import time
+from collections import Counter
+from itertools import accumulate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frequency_index import FrequencyIndex
+
+K = 10
+
+
+def zipf_batches(tokens, batch_size, vocabulary, seed=5):
+    """Yield batches of words drawn with probability proportional to 1 / rank."""
+    rng = random.Random(seed)
+    words = [f"word{i}" for i in range(vocabulary)]
+    cum_weights = list(accumulate(1 / rank for rank in range(1, vocabulary + 1)))
+    for start in range(0, tokens, batch_size):
+        yield rng.choices(words, cum_weights=cum_weights, k=min(batch_size, tokens - start))
+
+
+def main():
+    tokens = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    vocabulary = int(sys.argv[3]) if len(sys.argv) > 3 else 1_000_000
+    print(f"{tokens:,} tokens in batches of {batch_size:,}, vocabulary {vocabulary:,}, top {K}")
+
+    counter = Counter()
+    exact = FrequencyIndex(K)
+    approximate = FrequencyIndex(K, approximate=True)
+    timings = {"most_common": 0.0, "exact": 0.0, "approximate": 0.0}
+    mismatches = 0
+    for batch in zipf_batches(tokens, batch_size, vocabulary):
+        start = time.perf_counter()
+        counter.update(batch)
+        expected = counter.most_common(K)
+        timings["most_common"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        top = exact.update(batch).top()
+        timings["exact"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        approximate.update(batch).top()
+        timings["approximate"] += time.perf_counter() - start
+
+        mismatches += [count for _, count in top] != [count for _, count in expected]
+
+    baseline = timings["most_common"]
+    for label, seconds in timings.items():
+        print(f"{label:<12} {seconds:8.2f} s  {tokens / seconds:>12,.0f} tokens/s  "
+              f"{baseline / seconds:5.1f}x")
+    print(f"Exact top-{K} differed from most_common after {mismatches} batches")
+    print(f"Distinct words: {len(counter):,}; sketch: {approximate.sketch.nbytes / 2**20:.1f} MiB "
+          f"for any vocabulary")
+    errors = [approximate.count(word) - count for word, count in counter.most_common(K)]
+    print(f"Approximate overcount on the true top {K}: max {max(errors):,} "
+          f"({max(errors) / tokens:.4%} of all tokens)")
+
+
+if __name__ == "__main__":
+    main()
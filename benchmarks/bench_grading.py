@@ -0,0 +1,50 @@
+"""
+Benchmark: week2 calculate_letter_grade loop vs grading.grade_batch.
+
+Run from the repository root:
+    python benchmarks/bench_grading.py [scores]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grading import grade_batch, np, to_messages
+from week2_control_flow_functions import calculate_letter_grade
+
+EDGE_CASES = [95, 83, 77, 65, 45, "invalid", 105, -1, 0, 100, 90, 89.999, "60", " 70 ",
+              "1e2", "nan", "inf", "-inf", "", True, 59.9999999]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+    expected = [calculate_letter_grade(score) for score in EDGE_CASES]
+    actual = to_messages(grade_batch(EDGE_CASES))
+    mismatches = [(s, e, a) for s, e, a in zip(EDGE_CASES, expected, actual) if e != a]
+    print(f"Edge cases: {len(EDGE_CASES)} checked, {len(mismatches)} mismatches {mismatches or ''}")
+
+    rng = random.Random(3)
+    scores = [round(rng.uniform(-5, 105), 1) for _ in range(rows)]
+
+    start = time.perf_counter()
+    scalar = [calculate_letter_grade(score) for score in scores]
+    scalar_time = time.perf_counter() - start
+
+    batch_input = np.array(scores) if np is not None else scores
+    start = time.perf_counter()
+    batch = grade_batch(batch_input)
+    batch_time = time.perf_counter() - start
+
+    same = scalar == to_messages(batch)
+    print(f"Scores:       {rows:,}")
+    print(f"Scalar loop:  {scalar_time:.3f}s ({rows / scalar_time:,.0f} scores/s)")
+    print(f"grade_batch:  {batch_time:.3f}s ({rows / batch_time:,.0f} scores/s)")
+    print(f"Speed-up:     {scalar_time / batch_time:.1f}x, results identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: the cost of importing the weekly lesson files.
+
+The lessons used to run all their demos at import time. They now keep
+the demos in main(), so the import cost before the change is the cost
+of importing the module and calling main(). Each case runs in a fresh
+interpreter under `python -X importtime`, with the lesson's printing
+sent to /dev/null.
+
+Run from the repository root:
+    python benchmarks/bench_import_time.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LESSONS = [
+    "week1_python_basics",
+    "week2_control_flow_functions",
+    "week3_data_structures_oop",
+]
+
+REPEATS = 7
+
+
+def import_time_us(code, module):
+    """Cumulative -X importtime microseconds for module, plus wall time of `code`."""
+    program = f"import time; start = time.perf_counter(); {code}; " \
+              f"import sys; print(time.perf_counter() - start, file=sys.stderr)"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", program],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True,
+    )
+    lines = result.stderr.splitlines()
+    cumulative = None
+    for line in lines:
+        # "import time:   self [us] | cumulative | imported package"
+        if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == module:
+            cumulative = int(line.split("|")[1])
+    return cumulative, float(lines[-1]) * 1e6
+
+
+def median_times(code, module):
+    runs = [import_time_us(code, module) for _ in range(REPEATS)]
+    return statistics.median(r[0] for r in runs), statistics.median(r[1] for r in runs)
+
+
+def main():
+    print(f"Median of {REPEATS} fresh interpreters, in microseconds")
+    print(f"{'lesson':<30} {'-X importtime':>14} {'import':>10} {'import + main()':>16} {'speedup':>8}")
+    for module in LESSONS:
+        importtime, after = median_times(f"import {module}", module)
+        _, before = median_times(f"import {module}; {module}.main()", module)
+        print(f"{module:<30} {importtime:>14,.0f} {after:>10,.0f} {before:>16,.0f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
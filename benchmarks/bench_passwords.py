@@ -0,0 +1,82 @@
+"""
+Benchmark: the Week 2 instructor validate_password vs passwords.validate_password.
+
+Run from the repository root:
+    python benchmarks/bench_passwords.py [passwords]
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lesson_functions import load_lesson_function
+from passwords import VALID, audit_passwords, validate_password
+
+original_validate_password = load_lesson_function("week2_control_flow_functions.py", "validate_password")
+
+ALPHABET = string.ascii_letters + string.digits + "@#$%!-_ "
+UNICODE_ALPHABET = ALPHABET + "ÄéßΣ٣"
+
+
+def all_failures_original_style(password):
+    """The original rules, but checking all of them - five any() scans."""
+    try:
+        failures = []
+        if len(password) < 8:
+            failures.append("Password too short")
+        if not any(c.isupper() for c in password):
+            failures.append("Missing uppercase letter")
+        if not any(c.islower() for c in password):
+            failures.append("Missing lowercase letter")
+        if not any(c.isdigit() for c in password):
+            failures.append("Missing digit")
+        if not any(c in "@#$%" for c in password):
+            failures.append("Missing special character")
+        return not failures, failures
+    except Exception as e:
+        return False, [f"Error: {e}"]
+
+
+def timed(label, func, candidates):
+    start = time.perf_counter()
+    results = [func(p) for p in candidates]
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34} {elapsed:.3f}s ({len(candidates) / elapsed:,.0f}/s)")
+    return results
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(9)
+    # Mostly ASCII, with 1 in 50 passwords drawing on non-ASCII letters and digits
+    candidates = [
+        "".join(rng.choices(UNICODE_ALPHABET if rng.random() < 0.02 else ALPHABET, k=rng.randint(6, 20)))
+        for _ in range(rows)
+    ]
+    candidates[:6] = ["weak", "StrongPass1@", "nodigits@", "NOLOWER1@", "", None]
+
+    print(f"{rows:,} passwords")
+    original = timed("original (stops at first failure)", original_validate_password, candidates)
+    all_rules = timed("original rules, all failures", all_failures_original_style, candidates)
+    results = timed("single pass, all failures", validate_password, candidates)
+
+    # The original stops at the first failure - it must match our first failure
+    first_mismatches = sum(
+        1 for (ok, message), (new_ok, failures) in zip(original, results)
+        if ok != new_ok or message != (failures[0] if failures else VALID)
+    )
+    all_mismatches = sum(1 for a, b in zip(all_rules, results) if a != b)
+    print(f"  mismatches: {first_mismatches} (first failure), {all_mismatches} (all failures)")
+
+    start = time.perf_counter()
+    summary = audit_passwords(candidates).run().summary()
+    print(f"  audit_passwords                    {time.perf_counter() - start:.3f}s")
+    print(f"Audit summary: {summary}")
+
+
+if __name__ == "__main__":
+    main()
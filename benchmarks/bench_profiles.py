@@ -0,0 +1,91 @@
+"""
+Benchmark: Week 2 create_profile vs profiles.render_profiles on 1M profiles.
+
+Run from the repository root:
+    python benchmarks/bench_profiles.py [profiles]
+"""
+
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from profiles import render_profile, render_profiles
+from week2_control_flow_functions import create_profile
+
+CITIES = ["Boston", "Harare", "Nairobi", "Lagos", "Accra"]
+
+
+def generate_profiles(count):
+    for i in range(count):
+        if i % 10 == 0:
+            yield {"name": f"User {i}", "email": f"user{i}@example.com"}
+        else:
+            yield {"name": f"User {i}", "age": 18 + i % 60, "city": CITIES[i % 5], "hobby": "reading"}
+
+
+class NullWriter:
+    """Counts characters instead of keeping them, so memory stays flat."""
+
+    def __init__(self):
+        self.characters = 0
+
+    def write(self, text):
+        self.characters += len(text)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    odd_keys = {"first_name": "{x}", "ZIP code": 12345, "": None, "{label}": "ok"}
+    assert render_profile(odd_keys) == create_profile(**odd_keys)
+    sample = list(generate_profiles(1000))
+    assert all(render_profile(p) == create_profile(**p) for p in sample)
+    expected = io.StringIO()
+    for p in sample:
+        expected.write(create_profile(**p))
+    actual = io.StringIO()
+    render_profiles(sample, actual)
+    assert actual.getvalue() == expected.getvalue()
+
+    start = time.perf_counter()
+    out = NullWriter()
+    for p in generate_profiles(count):
+        out.write(create_profile(**p))
+    original_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    out = NullWriter()
+    render_profiles(generate_profiles(count), out)
+    new_time = time.perf_counter() - start
+
+    # Memory is traced on a separate run - tracing slows everything down
+    tracemalloc.start()
+    render_profiles(generate_profiles(min(count, 200_000)), NullWriter())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"Profiles:          {count:,} ({out.characters / 1e6:.1f} MB of text)")
+    print(f"create_profile:    {original_time:.2f}s ({count / original_time:,.0f}/s)")
+    print(f"render_profiles:   {new_time:.2f}s ({count / new_time:,.0f}/s), "
+          f"{original_time / new_time:.1f}x faster")
+    print(f"Peak traced memory while rendering: {peak / 1e6:.1f} MB")
+
+    # Wide profiles are where repeated += hurts most
+    wide = [{f"field_{k}": "x" * 40 for k in range(200)} for _ in range(2000)]
+    start = time.perf_counter()
+    for p in wide:
+        create_profile(**p)
+    original_time = time.perf_counter() - start
+    start = time.perf_counter()
+    render_profiles(wide, NullWriter())
+    new_time = time.perf_counter() - start
+    print(f"200-key profiles:  create_profile {original_time:.2f}s, render_profiles {new_time:.2f}s "
+          f"({original_time / new_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: indexed Library vs a linear list scan at 1M books.
+
+Times bulk loading, then each kind of search (author, year range, title
+prefix) against the list comprehension the Week 3 exercise would use.
+Also times single add / update / remove calls, which keep every index
+current.
+
+Run from the repository root:
+    python benchmarks/bench_record_store.py [books]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from record_store import Book, Library
+
+WORDS = ("river silent night garden code python django rest data light stone winter "
+         "lost city empire shadow glass ocean iron crown song fire quiet north").split()
+QUERIES = 200
+
+
+def generate_books(count, seed=4):
+    rng = random.Random(seed)
+    authors = [f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}son {i}" for i in range(count // 50)]
+    return [Book(i, " ".join(rng.choices(WORDS, k=4)).title() + f" {i}", rng.choice(authors),
+                 rng.randint(1800, 2024)) for i in range(count)], authors
+
+
+def per_call_us(func, args_list):
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    return (time.perf_counter() - start) / len(args_list) * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(8)
+    books, authors = generate_books(count)
+
+    start = time.perf_counter()
+    library = Library(books)
+    print(f"Loaded {len(library):,} books in {time.perf_counter() - start:.2f} s")
+
+    author_queries = [(rng.choice(authors),) for _ in range(QUERIES)]
+    year_queries = [(year, year + 1) for year in (rng.randint(1800, 2023) for _ in range(QUERIES))]
+    prefix_queries = [(" ".join(rng.choices(WORDS, k=2)),) for _ in range(QUERIES)]
+    scan_count = max(1, QUERIES // 20)
+
+    searches = [
+        ("author", library.by_author,
+         lambda author: [b for b in books if b.author.casefold() == author.casefold()], author_queries),
+        ("year range (2 years)", library.published_between,
+         lambda low, high: [b for b in books if low <= b.year <= high], year_queries),
+        ("year range, first 10", lambda low, high: library.published_between(low, high, 10),
+         lambda low, high: [b for b in books if low <= b.year <= high][:10], year_queries),
+        ("title prefix (10)", library.autocomplete,
+         lambda text: [b for b in books if b.title.casefold().startswith(text.casefold())][:10], prefix_queries),
+    ]
+    print(f"{'search':<22} {'indexed':>12} {'list scan':>14} {'speedup':>10}")
+    for label, indexed, scan, queries in searches:
+        indexed_us = per_call_us(indexed, queries)
+        scan_us = per_call_us(scan, queries[:scan_count])
+        print(f"{label:<22} {indexed_us:>9,.1f} us {scan_us / 1000:>11,.1f} ms {scan_us / indexed_us:>9,.0f}x")
+
+    # Full results must match the scan (limited ones come back in index order instead)
+    for _, indexed, scan, queries in searches[:2]:
+        for query in queries[:scan_count]:
+            assert sorted(b.book_id for b in indexed(*query)) == sorted(b.book_id for b in scan(*query))
+
+    new_books = [Book(count + i, f"New Title {i}", rng.choice(authors), 2025) for i in range(QUERIES)]
+    add_us = per_call_us(library.add, [(book,) for book in new_books])
+    update_us = per_call_us(lambda book_id: library.update(book_id, year=rng.randint(1800, 2024)),
+                            [(rng.randrange(count),) for _ in range(QUERIES)])
+    remove_us = per_call_us(library.remove, [(book.book_id,) for book in new_books])
+    print(f"add {add_us:,.1f} us, update {update_us:,.1f} us, remove {remove_us:,.1f} us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: SlidingWindow throughput on 10M events.
+
+Measures a count window (last 1,000 values), a 60-second time window
+over synthetic timestamps, and a count window that also feeds a
+RunningStats accumulator. Each is timed over a stream of tax amounts.
+For scale, it also times recomputing sum/min/max over a list slice of
+the last 1,000 values on every event, on a 100k-event prefix.
+
+Run from the repository root:
+    python benchmarks/bench_sliding_window.py [events]
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assignment1 import calculate_tax_batch
+from running_stats import RunningStats
+from sliding_window import SlidingWindow
+
+WINDOW = 1000
+DURATION = 60.0
+NAIVE_EVENTS = 100_000
+
+
+def naive(values, size):
+    """Recompute every aggregate from a slice on each event."""
+    result = None
+    for i in range(len(values)):
+        recent = values[max(0, i - size + 1):i + 1]
+        result = (math.fsum(recent), min(recent), max(recent))
+    return result
+
+
+def timed(label, events, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:7.2f} s  {events / elapsed:>12,.0f} events/s")
+    return result
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = random.Random(9)
+    print(f"Generating {events:,} taxes ...")
+    taxes = calculate_tax_batch([rng.uniform(0, 20_000) for _ in range(events)]).tolist()
+    timestamps = []
+    now = 0.0
+    for _ in range(events):
+        now += rng.expovariate(100.0)  # about 100 events per second
+        timestamps.append(now)
+
+    window = timed(f"count window ({WINDOW:,})", events,
+                   lambda: SlidingWindow(size=WINDOW).add_many(taxes))
+    timed(f"time window ({DURATION:g} s)", events,
+          lambda: SlidingWindow(duration=DURATION).add_many(taxes, timestamps))
+    fed = timed("count window + RunningStats", events,
+                lambda: SlidingWindow(size=WINDOW, stats=RunningStats()).add_many(taxes))
+    expected = timed(f"list slice per event ({NAIVE_EVENTS:,})", NAIVE_EVENTS,
+                     lambda: naive(taxes[:NAIVE_EVENTS], WINDOW))
+
+    recent = taxes[-WINDOW:]
+    print(f"Last window: sum {window.sum:,.2f} (fsum {math.fsum(recent):,.2f}), "
+          f"min {window.min:,.2f}, max {window.max:,.2f}")
+    check = SlidingWindow(size=WINDOW).add_many(taxes[:NAIVE_EVENTS])
+    matches = math.isclose(check.sum, expected[0]) and (check.min, check.max) == expected[1:]
+    print(f"Matches list slice on the prefix: {matches}")
+    print(f"Lifetime stats: {fed.stats.count:,} taxes, mean {fed.stats.mean:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
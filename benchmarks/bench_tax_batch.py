@@ -0,0 +1,47 @@
+"""
+Benchmark: scalar calculate_tax loop vs calculate_tax_batch.
+
+Run from the repository root:
+    python benchmarks/bench_tax_batch.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assignment1 import calculate_tax, calculate_tax_batch, np
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    if np is None:
+        print("NumPy is not installed - the batch engine uses the plain Python fallback.")
+
+    rng = random.Random(42)
+    incomes = [rng.uniform(0, 20000) for _ in range(rows)]
+    # Make sure the exact bracket edges are covered too
+    incomes[:4] = [999.99, 1000.0, 5000.0, 5000.01]
+
+    start = time.perf_counter()
+    scalar = [calculate_tax(income) for income in incomes]
+    scalar_time = time.perf_counter() - start
+
+    batch_input = np.array(incomes) if np is not None else incomes
+    start = time.perf_counter()
+    batch = calculate_tax_batch(batch_input)
+    batch_time = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(scalar, batch) if a != b)
+
+    print(f"Rows:          {rows:,}")
+    print(f"Scalar loop:   {scalar_time:.3f}s ({rows / scalar_time:,.0f} rows/s)")
+    print(f"Batch engine:  {batch_time:.3f}s ({rows / batch_time:,.0f} rows/s)")
+    print(f"Speed-up:      {scalar_time / batch_time:.1f}x")
+    print(f"Mismatches:    {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
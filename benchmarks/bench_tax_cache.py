@@ -0,0 +1,63 @@
+"""
+Benchmark: cached vs uncached tax lookups on skewed (Zipf-like) income data.
+
+Run from the repository root:
+    python benchmarks/bench_tax_cache.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import assignment1
+from assignment1 import Citizen, calculate_tax_cached
+from tax_schedule import TaxSchedule
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+EXAMPLE_SCHEDULE = os.path.join(os.path.dirname(BENCH_DIR), "tax_brackets_example.json")
+
+
+def skewed_incomes(rows, bands, seed=7):
+    """A few salary bands dominate: band k is picked with weight 1/k."""
+    rng = random.Random(seed)
+    salaries = [round(rng.uniform(500, 200000), 2) for _ in range(bands)]
+    weights = [1 / (k + 1) for k in range(bands)]
+    return rng.choices(salaries, weights=weights, k=rows)
+
+
+def timed(label, func, rows):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<32} {elapsed:.3f}s ({rows / elapsed:,.0f} lookups/s)")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    schedule = TaxSchedule.from_file(EXAMPLE_SCHEDULE)
+
+    for bands in (1_000, 100_000):
+        incomes = skewed_incomes(rows, bands)
+        citizens = [Citizen("x", income) for income in incomes]
+        print(f"\n{rows:,} lookups over {bands:,} salary bands")
+
+        assignment1.disable_tax_cache()
+        timed("Citizen.get_tax_amount", lambda: [c.get_tax_amount() for c in citizens], rows)
+        timed("schedule.tax (progressive)", lambda: [schedule.tax(i) for i in incomes], rows)
+
+        cache = assignment1.enable_tax_cache(maxsize=4096)
+        timed("cached get_tax_amount", lambda: [c.get_tax_amount() for c in citizens], rows)
+        schedule_tax = cache.schedule_tax
+        timed("cached schedule.tax", lambda: [schedule_tax(schedule, i) for i in incomes], rows)
+        timed("calculate_tax_cached(schedule)", lambda: [calculate_tax_cached(i, schedule) for i in incomes], rows)
+        stats = cache.stats()
+        print(f"  cache (all cached runs): {stats['hits']:,} hits, {stats['misses']:,} misses, "
+              f"{stats['evictions']:,} evictions, hit rate {stats['hit_rate']:.1%}")
+        assignment1.disable_tax_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: single-process analyze_stream vs map-reduce analyze_corpus.
+
+Generates a corpus (1 GB by default) in a temporary directory, then runs
+from the repository root:
+    python benchmarks/bench_text_corpus.py [size_mb] [max_workers]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_analysis import TextCounter, analyze_corpus, corpus_files, count_shard
+
+WORDS = ("the quick brown fox jumps over lazy dog python django naïve café "
+         "data structure mentor lesson week").split()
+
+
+def generate_corpus(directory, size_mb, files=8, seed=11):
+    """Write `files` text files totalling about size_mb megabytes."""
+    rng = random.Random(seed)
+    per_file = size_mb * 1024 * 1024 // files
+    for i in range(files):
+        with open(os.path.join(directory, f"part-{i:03d}.txt"), "w", encoding="utf-8") as f:
+            written = 0
+            while written < per_file:
+                sentence = " ".join(rng.choices(WORDS, k=rng.randint(4, 14)))
+                block = (sentence.capitalize() + rng.choice(".!?") + " ") * 200 + "\n"
+                f.write(block)
+                written += len(block.encode("utf-8"))
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    directory = tempfile.mkdtemp(prefix="corpus-")
+    try:
+        print(f"Generating {size_mb} MB corpus in {directory} ...")
+        generate_corpus(directory, size_mb)
+
+        start = time.perf_counter()
+        total = TextCounter()
+        for path in corpus_files(directory):
+            total.merge(count_shard(path, 0, os.path.getsize(path)), contiguous=False)
+        expected = total.result()
+        serial = time.perf_counter() - start
+        print(f"Single process:  {serial:.2f}s ({size_mb / serial:,.1f} MB/s)")
+
+        workers = 1
+        while workers <= max_workers:
+            start = time.perf_counter()
+            result = analyze_corpus(directory, workers=workers)
+            elapsed = time.perf_counter() - start
+            print(f"{workers:>2} worker(s):    {elapsed:.2f}s ({size_mb / elapsed:,.1f} MB/s, "
+                  f"{serial / elapsed:.2f}x) exact: {result == expected}")
+            workers *= 2
+        print(f"Result: {expected}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: try/except-per-value parsing (as in get_user_age) vs the
+schema-driven bulk validator, on columns with ~20% malformed rows and on
+clean columns.
+
+Run from the repository root:
+    python benchmarks/bench_validation.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validation import (ABOVE_MAX, AGE_RULE, BELOW_MIN, INCOME_RULE, NOT_A_NUMBER, OK,
+                        error_counts, validate_columns)
+
+
+def age_try_except(text):
+    """The get_user_age() approach for one value, returning a code instead of printing."""
+    try:
+        age = int(text)
+        if age < 0:
+            raise ValueError("Age cannot be negative")
+        if age > 150:
+            raise ValueError("Age seems unrealistic")
+        return age, OK
+    except ValueError as e:
+        if "invalid literal" in str(e):
+            return None, NOT_A_NUMBER
+        return None, BELOW_MIN if "negative" in str(e) else ABOVE_MAX
+
+
+def income_try_except(text):
+    """The assignment1.main() income check for one value."""
+    try:
+        income = float(text)
+    except ValueError:
+        return None, NOT_A_NUMBER
+    if income < 0:
+        return None, BELOW_MIN
+    return income, OK
+
+
+EDGE_AGES = ["25", "abc", "-5", "30", " 42 ", "+7", "1_0", "1__0", "", "151", "150", "0", "٣", "4.5", "-0"]
+EDGE_INCOMES = ["100", "-1", "1e3", ".5", "5.", "inf", "-inf", "nan", "1_000.5", "abc", "", " 12 ", "1e", "--1"]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+
+    for rule, reference, edge in ((AGE_RULE, age_try_except, EDGE_AGES),
+                                  (INCOME_RULE, income_try_except, EDGE_INCOMES)):
+        for text in edge:
+            value, code = rule.validate(text)
+            expected_value, expected_code = reference(text)
+            same_value = value == expected_value or (value != value and expected_value != expected_value)
+            assert code == expected_code and same_value, (text, value, code, expected_value, expected_code)
+
+    rng = random.Random(4)
+    bad = ["abc", "", "12a", "N/A", "--"]
+    ages = [str(rng.randint(-20, 200)) if rng.random() > 0.2 else rng.choice(bad) for _ in range(rows)]
+    incomes = [f"{rng.uniform(-500, 20000):.2f}" if rng.random() > 0.2 else rng.choice(bad) for _ in range(rows)]
+
+    start = time.perf_counter()
+    age_codes = [age_try_except(a)[1] for a in ages]
+    income_codes = [income_try_except(i)[1] for i in incomes]
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = validate_columns({"age": ages, "income": incomes},
+                               {"age": AGE_RULE, "income": INCOME_RULE})
+    new_time = time.perf_counter() - start
+
+    same = list(results["age"].codes) == age_codes and list(results["income"].codes) == income_codes
+    print(f"Rows:               {rows:,} per column, ~20% malformed")
+    print(f"try/except per row: {old_time:.2f}s ({2 * rows / old_time:,.0f} values/s)")
+    print(f"validate_columns:   {new_time:.2f}s ({2 * rows / new_time:,.0f} values/s), "
+          f"{old_time / new_time:.1f}x faster, identical codes: {same}")
+    print(f"Age error counts:    {error_counts(results['age'])}")
+    print(f"Income error counts: {error_counts(results['income'])}")
+
+    # Clean columns convert in bulk without falling back to single rows
+    ages = [str(rng.randint(0, 150)) for _ in range(rows)]
+    incomes = [f"{rng.uniform(0, 20000):.2f}" for _ in range(rows)]
+    start = time.perf_counter()
+    age_codes = [age_try_except(a)[1] for a in ages]
+    income_codes = [income_try_except(i)[1] for i in incomes]
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = validate_columns({"age": ages, "income": incomes},
+                               {"age": AGE_RULE, "income": INCOME_RULE})
+    new_time = time.perf_counter() - start
+    same = list(results["age"].codes) == age_codes and list(results["income"].codes) == income_codes
+    print(f"Clean columns:      try/except {old_time:.2f}s, validate_columns {new_time:.2f}s, "
+          f"{old_time / new_time:.1f}x faster, identical codes: {same}")
+
+
+if __name__ == "__main__":
+    main()
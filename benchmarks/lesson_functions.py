@@ -0,0 +1,26 @@
+"""
+Load functions nested inside the lesson scripts.
+
+Top-level definitions import normally. The Week 2 instructor solutions
+(validate_password, fibonacci_iterative) are defined inside
+instructor_solutions(), so benchmarks compile just those definitions.
+"""
+
+import ast
+import os
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_lesson_function(filename, name, namespace=None):
+    """Compile and return the (possibly nested) def or class `name` from a lesson file."""
+    path = os.path.join(REPO_DIR, filename)
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and node.name == name:
+            module = ast.Module(body=[node], type_ignores=[])
+            namespace = dict(namespace or {})
+            exec(compile(module, path, "exec"), namespace)
+            return namespace[name]
+    raise LookupError(f"{name} not found in {filename}")
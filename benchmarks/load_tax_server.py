@@ -0,0 +1,78 @@
+"""
+Load generator for tax_server.py.
+
+Start the server, then run from the repository root:
+    python tax_server.py --port 8080 &
+    python benchmarks/load_tax_server.py --port 8080 --connections 64 --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def client(host, port, count, latencies, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(count):
+            body = json.dumps({"name": f"Citizen {seed}-{i}", "income": round(rng.uniform(0, 20000), 2)})
+            request = (f"POST /tax HTTP/1.1\r\nHost: {host}\r\n"
+                       f"Content-Type: application/json\r\n"
+                       f"Content-Length: {len(body)}\r\n\r\n{body}")
+            start = time.perf_counter()
+            writer.write(request.encode("utf-8"))
+            await writer.drain()
+
+            length = 0
+            status = await reader.readline()
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if not status.startswith(b"HTTP/1.1 200"):
+                raise RuntimeError(f"Unexpected response: {status!r}")
+    finally:
+        writer.close()
+
+
+async def run(host, port, connections, requests):
+    latencies = []
+    per_client = max(1, requests // connections)
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, per_client, latencies, seed) for seed in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Requests:     {len(latencies):,} over {connections} connections")
+    print(f"Throughput:   {len(latencies) / elapsed:,.0f} req/s")
+    for label, fraction in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("p99.9", 0.999)):
+        print(f"Latency {label:<5} {percentile(latencies, fraction) * 1000:8.2f} ms")
+    print(f"Latency max   {latencies[-1] * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for tax_server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(run(args.host, args.port, args.connections, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Multithreaded stress test for AccountLedger.
+
+Runs random transfers from a thread pool, then checks that money was
+neither created nor destroyed. Run from the repository root:
+    python benchmarks/stress_ledger.py [threads] [operations]
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ledger import AccountLedger
+
+ACCOUNTS = 10_000
+OPENING_BALANCE = 1_000
+BATCH = 1_000
+
+
+def worker(ledger, seed, operations):
+    rng = random.Random(seed)
+    done = 0
+    while done < operations:
+        batch = []
+        for _ in range(min(BATCH, operations - done)):
+            source, target = rng.sample(range(ACCOUNTS), 2)
+            batch.append(("transfer", source, target, rng.randint(1, 300)))
+        ledger.apply_transactions(batch)
+        done += len(batch)
+    return done
+
+
+def run(stripes, threads, operations):
+    ledger = AccountLedger(stripes)
+    for account_id in range(ACCOUNTS):
+        ledger.open_account(account_id, OPENING_BALANCE)
+    expected = ledger.total()
+
+    per_thread = operations // threads
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        done = sum(pool.map(worker, [ledger] * threads, range(threads), [per_thread] * threads))
+    elapsed = time.perf_counter() - start
+
+    total = ledger.total()
+    negative = sum(1 for account_id in range(ACCOUNTS) if ledger.balance(account_id) < 0)
+    status = "OK" if total == expected and not negative else "FAILED"
+    print(f"stripes={stripes:<4} threads={threads:<3} {done:,} transfers in {elapsed:.2f}s "
+          f"({done / elapsed:,.0f} ops/s) total {total:,} (expected {expected:,}), "
+          f"negative balances: {negative} -> {status}")
+    return status == "OK"
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 400_000
+    ok = all([run(stripes, threads, operations) for stripes in (1, 16, 256)])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Fibonacci numbers at huge indices.
+
+- fib(n): the n-th Fibonacci number in O(log n) big-integer steps using
+  the fast-doubling identities
+      F(2k)   = F(k) * (2*F(k+1) - F(k))
+      F(2k+1) = F(k)**2 + F(k+1)**2
+- fibonacci_numbers(limit): lazy version of the Week 2 fibonacci_iterative()
+  that yields the terms instead of building a list
+- cached_fib(n): fib() behind a bounded LRU memo for repeated queries
+"""
+
+from functools import lru_cache
+
+# How many distinct indices cached_fib() remembers
+MEMO_SIZE = 256
+
+
+def _fib_pair(n):
+    """Return (F(n), F(n+1)) by walking the bits of n from the top."""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        # (a, b) = (F(k), F(k+1)) -> (F(2k), F(2k+1))
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib(n):
+    """The n-th Fibonacci number, with fib(0) == 0 and fib(1) == 1."""
+    if not isinstance(n, int) or isinstance(n, bool):
+        raise TypeError("n must be an integer")
+    if n < 0:
+        raise ValueError("n must not be negative")
+    return _fib_pair(n)[0]
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def cached_fib(n):
+    """fib(n), remembered for the MEMO_SIZE most recently used indices."""
+    return fib(n)
+
+
+def fibonacci_numbers(limit):
+    """Yield the Fibonacci numbers up to and including limit.
+
+    Same terms as fibonacci_iterative(limit), without building the list.
+    """
+    if limit <= 0:
+        return
+    a, b = 0, 1
+    while a <= limit:
+        yield a
+        a, b = b, a + b
@@ -0,0 +1,221 @@
+"""
+Word frequencies with a top-k list that stays current as batches arrive.
+
+Week 3 counts words with Counter(words).most_common(2). most_common(k)
+looks at every distinct word again on each call, which is too slow when
+a dashboard wants the top k after every ingestion batch. FrequencyIndex
+keeps the current top k in a small dict instead. Counts only grow, so
+only the words in the new batch can change the ranking. Each batch
+therefore costs time proportional to its own distinct words, not to the
+whole vocabulary.
+
+- Exact mode keeps every count in a Counter.
+- Approximate mode keeps a fixed-size count-min sketch plus the top-k
+  words, so memory stays bounded however large the vocabulary grows.
+  Counts may be overestimated (never underestimated) by hash collisions.
+- merge() combines indexes built by parallel workers.
+
+    index = FrequencyIndex(k=10)
+    for batch in batches:
+        index.update(batch)
+        print(index.top())
+"""
+
+import random
+import zlib
+from array import array
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+
+# NumPy is optional - the sketch falls back to plain Python rows without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Mersenne prime for the sketch's universal hash functions
+_PRIME = (1 << 31) - 1
+
+DEFAULT_WIDTH = 1 << 16
+DEFAULT_DEPTH = 4
+
+
+def _key(word):
+    """A hash of word that is the same in every process (unlike hash())."""
+    return zlib.crc32(word.encode("utf-8"))
+
+
+class CountMinSketch:
+    """Approximate counts in depth x width counters.
+
+    Each row hashes a word to one counter; the estimate is the smallest
+    of its counters. Sketches built with the same width, depth and seed
+    can be merged by adding their tables.
+    """
+
+    def __init__(self, width=DEFAULT_WIDTH, depth=DEFAULT_DEPTH, seed=0):
+        if width < 1 or depth < 1:
+            raise ValueError("Width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _PRIME) for _ in range(depth)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(depth)]
+        if np is not None:
+            self.table = np.zeros((depth, width), dtype=np.int64)
+            self._np_a = np.array(self._a, dtype=np.int64)[:, None]
+            self._np_b = np.array(self._b, dtype=np.int64)[:, None]
+        else:
+            self.table = [array("q", bytes(8 * width)) for _ in range(depth)]
+
+    @property
+    def nbytes(self):
+        if np is not None:
+            return self.table.nbytes
+        return sum(row.itemsize * len(row) for row in self.table)
+
+    def _columns(self, words):
+        """Column index of every word in every row: depth x len(words)."""
+        if np is not None:
+            keys = np.fromiter(map(_key, words), dtype=np.int64, count=len(words))
+            return (self._np_a * keys + self._np_b) % _PRIME % self.width
+        keys = [_key(word) for word in words]
+        return [[(a * key + b) % _PRIME % self.width for key in keys]
+                for a, b in zip(self._a, self._b)]
+
+    def add(self, counts):
+        """Add a {word: count} mapping and return the new estimates, in order."""
+        words = list(counts)
+        if not words:
+            return []
+        columns = self._columns(words)
+        if np is not None:
+            amounts = np.fromiter(counts.values(), dtype=np.int64, count=len(words))
+            rows = np.arange(self.depth)[:, None]
+            np.add.at(self.table, (rows, columns), amounts)
+            return self.table[rows, columns].min(axis=0).tolist()
+        amounts = list(counts.values())
+        for row, row_columns in zip(self.table, columns):
+            for column, amount in zip(row_columns, amounts):
+                row[column] += amount
+        return [min(row[column] for row, column in zip(self.table, word_columns))
+                for word_columns in zip(*columns)]
+
+    def estimate_many(self, words):
+        words = list(words)
+        if not words:
+            return []
+        columns = self._columns(words)
+        if np is not None:
+            return self.table[np.arange(self.depth)[:, None], columns].min(axis=0).tolist()
+        return [min(row[column] for row, column in zip(self.table, word_columns))
+                for word_columns in zip(*columns)]
+
+    def estimate(self, word):
+        return self.estimate_many([word])[0]
+
+    def merge(self, other):
+        """Add another sketch's counts into this one."""
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("Sketches must have the same width, depth and seed to merge")
+        if np is not None:
+            self.table += other.table
+        else:
+            for row, other_row in zip(self.table, other.table):
+                for column, amount in enumerate(other_row):
+                    row[column] += amount
+        return self
+
+
+class FrequencyIndex:
+    """Word counts with an incrementally maintained top-k list."""
+
+    def __init__(self, k=10, approximate=False, width=DEFAULT_WIDTH, depth=DEFAULT_DEPTH, seed=0):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self.total = 0
+        self.approximate = approximate
+        self.counts = None if approximate else Counter()
+        self.sketch = CountMinSketch(width, depth, seed) if approximate else None
+        self._top = {}  # word -> count for the current top k
+        self._threshold = 0  # a count must beat this to enter a full top k
+
+    def __repr__(self):
+        mode = "approximate" if self.approximate else "exact"
+        return f"FrequencyIndex(k={self.k}, {mode}, total={self.total})"
+
+    def update(self, words):
+        """Add one batch: an iterable of words or a {word: count} mapping."""
+        batch = words if isinstance(words, dict) else Counter(words)
+        if not batch:
+            return self
+        if min(batch.values()) < 1:
+            raise ValueError("Counts must be positive")
+        self.total += sum(batch.values())
+
+        top = self._top
+        threshold = self._threshold
+        if self.approximate:
+            for word, count in zip(batch, self.sketch.add(batch)):
+                if count > threshold:
+                    top[word] = count
+        else:
+            counts = self.counts
+            get = counts.get
+            for word, amount in batch.items():
+                count = get(word, 0) + amount
+                counts[word] = count
+                # Current top-k members always pass: their counts were >= threshold
+                if count > threshold:
+                    top[word] = count
+        self._trim()
+        return self
+
+    def _trim(self):
+        if len(self._top) > self.k:
+            # Existing members come first in the dict, so they win ties
+            self._top = dict(nlargest(self.k, self._top.items(), key=itemgetter(1)))
+        if len(self._top) == self.k:
+            self._threshold = min(self._top.values())
+
+    def top(self, k=None):
+        """The k most frequent (word, count) pairs, most frequent first.
+
+        Counts match Counter.most_common(k) in exact mode. Words with equal
+        counts may be listed in a different order.
+        """
+        k = self.k if k is None else k
+        if k > self.k:
+            if self.approximate:
+                raise ValueError(f"This index only tracks the top {self.k} words")
+            return self.counts.most_common(k)
+        return sorted(self._top.items(), key=itemgetter(1), reverse=True)[:k]
+
+    def count(self, word):
+        """How often word was seen (an upper bound in approximate mode)."""
+        if self.approximate:
+            return self.sketch.estimate(word)
+        return self.counts[word]
+
+    def merge(self, other):
+        """Add another index's counts, e.g. one built by a parallel worker.
+
+        In approximate mode the new top k is chosen from both indexes' top
+        words, so a word that was outside both lists cannot enter it.
+        """
+        if self.approximate != other.approximate:
+            raise ValueError("Cannot merge an exact index with an approximate one")
+        self.total += other.total
+        if self.approximate:
+            self.sketch.merge(other.sketch)
+            words = list(dict.fromkeys([*self._top, *other._top]))
+            candidates = zip(words, self.sketch.estimate_many(words))
+        else:
+            self.counts.update(other.counts)
+            candidates = self.counts.items()
+        self._top = dict(nlargest(self.k, candidates, key=itemgetter(1)))
+        self._threshold = min(self._top.values()) if len(self._top) == self.k else 0
+        return self
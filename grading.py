@@ -0,0 +1,117 @@
+"""
+Batch letter grading for whole exam cohorts.
+
+grade_batch() applies the same rules as calculate_letter_grade() in
+week2_control_flow_functions.py to an array of scores at once:
+
+- scores that float() cannot convert are flagged in the `invalid` mask
+- scores below 0 or above 100 are flagged in the `out_of_range` mask
+- everything else is mapped to A-F with one searchsorted over the cutoffs
+
+to_messages() turns a batch result back into exactly the strings the
+scalar function returns, error messages included.
+"""
+
+import bisect
+from collections import namedtuple
+
+# NumPy is optional - grading falls back to bisect without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Lowest score for D, C, B and A
+GRADE_CUTOFFS = (60, 70, 80, 90)
+LETTERS = ("F", "D", "C", "B", "A")
+
+if np is not None:
+    _NP_CUTOFFS = np.array(GRADE_CUTOFFS, dtype=np.float64)
+    _NP_LETTERS = np.array(LETTERS)
+
+# The scalar function's error messages
+INVALID_MESSAGE = "Error: Invalid score format"
+OUT_OF_RANGE_MESSAGE = "Error: Score must be between 0 and 100"
+
+# grades holds "" wherever one of the masks is set
+GradeBatch = namedtuple("GradeBatch", ["grades", "invalid", "out_of_range"])
+
+
+def _to_floats(scores):
+    """Convert scores with float() semantics, returning (values, invalid mask)."""
+    if isinstance(scores, np.ndarray) and scores.dtype.kind in "biuf":
+        values = scores.astype(np.float64, copy=False)
+        return values, np.zeros(len(values), dtype=bool)
+    try:
+        values = np.asarray(scores, dtype=np.float64)
+        if values.ndim == 1:
+            return values, np.zeros(len(values), dtype=bool)
+    except (TypeError, ValueError):
+        pass
+
+    # Some entries are bad - convert one by one and remember which failed
+    scores = list(scores)
+    values = np.empty(len(scores), dtype=np.float64)
+    invalid = np.zeros(len(scores), dtype=bool)
+    for i, score in enumerate(scores):
+        try:
+            values[i] = float(score)
+        except (TypeError, ValueError):
+            values[i] = 0.0
+            invalid[i] = True
+    return values, invalid
+
+
+def grade_batch(scores):
+    """Grade an iterable or array of scores in one vectorized pass.
+
+    Unlike the scalar function, entries that float() rejects with a
+    TypeError (None, lists, ...) are flagged as invalid instead of raising.
+    """
+    if np is None:
+        return _grade_batch_python(scores)
+
+    values, invalid = _to_floats(scores)
+    out_of_range = ~invalid & ((values < 0) | (values > 100))
+
+    index = np.searchsorted(_NP_CUTOFFS, values, side="right")
+    # NaN passes the range check and falls through to "F" in the scalar function
+    index[np.isnan(values)] = 0
+    grades = _NP_LETTERS[index]
+    grades[invalid | out_of_range] = ""
+    return GradeBatch(grades, invalid, out_of_range)
+
+
+def _grade_batch_python(scores):
+    grades, invalid, out_of_range = [], [], []
+    for score in scores:
+        try:
+            value = float(score)
+        except (TypeError, ValueError):
+            grades.append("")
+            invalid.append(True)
+            out_of_range.append(False)
+            continue
+        bad_range = value < 0 or value > 100
+        if bad_range:
+            grades.append("")
+        elif value != value:  # NaN
+            grades.append("F")
+        else:
+            grades.append(LETTERS[bisect.bisect_right(GRADE_CUTOFFS, value)])
+        invalid.append(False)
+        out_of_range.append(bad_range)
+    return GradeBatch(grades, invalid, out_of_range)
+
+
+def to_messages(batch):
+    """Return what calculate_letter_grade() would return for each score."""
+    messages = []
+    for grade, is_invalid, is_out_of_range in zip(*batch):
+        if is_invalid:
+            messages.append(INVALID_MESSAGE)
+        elif is_out_of_range:
+            messages.append(OUT_OF_RANGE_MESSAGE)
+        else:
+            messages.append(str(grade))
+    return messages
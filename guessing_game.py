@@ -0,0 +1,111 @@
+"""
+Guessing game engine and Monte Carlo load simulator.
+
+number_guessing_game() in Week 2 replays a fixed list of guesses. Here:
+
+- solve() plays one game with binary search, which always finds the secret
+  within ceil(log2(range size + 1)) guesses - 7 for 1..100
+- simulate() plays millions of games across a process pool. Every worker
+  has its own random.Random seeded from the base seed, so a run is
+  repeatable, and nothing is printed per game.
+
+    python guessing_game.py --games 1000000 --low 1 --high 100 --workers 4
+"""
+
+import argparse
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+MAX_ATTEMPTS = 7
+
+# Games handed to a worker at a time
+GAMES_PER_TASK = 50_000
+
+
+def attempts_needed(low, high):
+    """Worst-case number of binary-search guesses for low..high."""
+    return (high - low + 1).bit_length()
+
+
+def solve(secret, low=1, high=100, max_attempts=MAX_ATTEMPTS):
+    """Play one game by binary search and return the number of guesses used."""
+    if not low <= secret <= high:
+        raise ValueError(f"Secret {secret} is outside {low}..{high}")
+    if max_attempts < attempts_needed(low, high):
+        raise ValueError(f"{max_attempts} attempts cannot cover {low}..{high}; "
+                         f"binary search needs {attempts_needed(low, high)}")
+    attempts = 0
+    while True:
+        attempts += 1
+        guess = (low + high) // 2
+        if guess == secret:
+            return attempts
+        if guess < secret:
+            low = guess + 1
+        else:
+            high = guess - 1
+
+
+def play_games(games, low, high, seed, max_attempts=MAX_ATTEMPTS):
+    """Worker: play `games` games with random secrets and count attempts."""
+    rng = random.Random(seed)
+    randint = rng.randint
+    counts = Counter()
+    for _ in range(games):
+        counts[solve(randint(low, high), low, high, max_attempts)] += 1
+    return counts
+
+
+def simulate(games, low=1, high=100, workers=None, seed=0, max_attempts=MAX_ATTEMPTS):
+    """Play `games` games and return a Counter of attempts -> number of games.
+
+    Games are split into fixed-size tasks seeded seed, seed + 1, ...; the
+    result depends only on the seed and the task size, not on how many
+    workers run them.
+    """
+    if max_attempts < attempts_needed(low, high):
+        raise ValueError(f"{max_attempts} attempts cannot cover {low}..{high}")
+    tasks = [min(GAMES_PER_TASK, games - start) for start in range(0, games, GAMES_PER_TASK)]
+    workers = workers or os.cpu_count() or 1
+    total = Counter()
+    if workers == 1:
+        for index, size in enumerate(tasks):
+            total.update(play_games(size, low, high, seed + index, max_attempts))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_games, size, low, high, seed + index, max_attempts)
+                   for index, size in enumerate(tasks)]
+        for future in futures:
+            total.update(future.result())
+    return total
+
+
+def print_distribution(counts):
+    games = sum(counts.values())
+    mean = sum(attempts * n for attempts, n in counts.items()) / games if games else 0
+    print(f"Games played: {games:,}  average attempts: {mean:.3f}  worst: {max(counts, default=0)}")
+    for attempts in sorted(counts):
+        share = counts[attempts] / games
+        print(f"  {attempts:>2} attempts: {counts[attempts]:>12,} ({share:6.2%}) {'#' * round(share * 50)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo simulation of the guessing game")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--low", type=int, default=1)
+    parser.add_argument("--high", type=int, default=100)
+    parser.add_argument("--max-attempts", type=int, default=None,
+                        help="defaults to the binary-search worst case for the range")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    max_attempts = args.max_attempts or attempts_needed(args.low, args.high)
+    counts = simulate(args.games, args.low, args.high, args.workers, args.seed, max_attempts)
+    print_distribution(counts)
+
+
+if __name__ == "__main__":
+    main()
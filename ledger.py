@@ -0,0 +1,135 @@
+"""
+Thread-safe ledger of many bank accounts.
+
+The Week 2 deposit/withdraw/check_balance functions share one global
+balance with no locking. AccountLedger holds any number of accounts keyed
+by ID and guards them with lock striping: N locks, each account hashed to
+one of them. Operations on accounts in different stripes run without
+waiting on each other, and a transfer takes its two stripe locks in a
+fixed order so concurrent transfers cannot deadlock.
+
+Use whole units (e.g. cents) for amounts if balances must add up exactly.
+"""
+
+import math
+import threading
+
+STRIPES = 64
+
+
+class AccountLedger:
+    """Many account balances behind N striped locks."""
+
+    def __init__(self, stripes=STRIPES):
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self._balances = {}
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def __len__(self):
+        return len(self._balances)
+
+    def __contains__(self, account_id):
+        return account_id in self._balances
+
+    def _stripe(self, account_id):
+        return hash(account_id) % len(self._locks)
+
+    def _check_account(self, account_id):
+        if account_id not in self._balances:
+            raise KeyError(f"Unknown account {account_id!r}")
+
+    def open_account(self, account_id, balance=0):
+        if not 0 <= balance < math.inf:
+            raise ValueError("Opening balance cannot be negative")
+        with self._locks[self._stripe(account_id)]:
+            if account_id in self._balances:
+                raise ValueError(f"Account {account_id!r} already exists")
+            self._balances[account_id] = balance
+
+    def balance(self, account_id):
+        with self._locks[self._stripe(account_id)]:
+            self._check_account(account_id)
+            return self._balances[account_id]
+
+    def deposit(self, account_id, amount):
+        if not 0 < amount < math.inf:
+            raise ValueError("Deposit amount must be positive")
+        with self._locks[self._stripe(account_id)]:
+            self._check_account(account_id)
+            self._balances[account_id] += amount
+            return self._balances[account_id]
+
+    def withdraw(self, account_id, amount):
+        if not 0 < amount < math.inf:
+            raise ValueError("Withdrawal amount must be positive")
+        with self._locks[self._stripe(account_id)]:
+            self._check_account(account_id)
+            if amount > self._balances[account_id]:
+                raise ValueError("Insufficient funds")
+            self._balances[account_id] -= amount
+            return self._balances[account_id]
+
+    def transfer(self, source_id, target_id, amount):
+        """Move amount between two accounts atomically."""
+        if not 0 < amount < math.inf:
+            raise ValueError("Transfer amount must be positive")
+        if source_id == target_id:
+            raise ValueError("Cannot transfer to the same account")
+        first, second = sorted((self._stripe(source_id), self._stripe(target_id)))
+        with self._locks[first]:
+            if second != first:
+                self._locks[second].acquire()
+            try:
+                self._check_account(source_id)
+                self._check_account(target_id)
+                if amount > self._balances[source_id]:
+                    raise ValueError("Insufficient funds")
+                self._balances[source_id] -= amount
+                self._balances[target_id] += amount
+            finally:
+                if second != first:
+                    self._locks[second].release()
+
+    def apply_transactions(self, transactions):
+        """Apply a batch of transactions, each independently.
+
+        Each transaction is a tuple:
+            ("deposit", account_id, amount)
+            ("withdraw", account_id, amount)
+            ("transfer", source_id, target_id, amount)
+
+        Returns one (ok, error message or None) pair per transaction; a
+        failed transaction does not stop the rest of the batch.
+        """
+        operations = {"deposit": self.deposit, "withdraw": self.withdraw, "transfer": self.transfer}
+        results = []
+        for transaction in transactions:
+            try:
+                kind, *args = transaction
+                operation = operations.get(kind)
+            except (TypeError, ValueError):
+                results.append((False, f"Malformed transaction {transaction!r}"))
+                continue
+            if operation is None:
+                results.append((False, f"Unknown transaction type {kind!r}"))
+                continue
+            try:
+                operation(*args)
+                results.append((True, None))
+            except (KeyError, ValueError) as e:
+                results.append((False, str(e.args[0]) if e.args else str(e)))
+            except TypeError as e:
+                # Wrong number of fields, or an amount that is not a number
+                results.append((False, f"Malformed transaction {transaction!r}: {e}"))
+        return results
+
+    def total(self):
+        """Sum of all balances, taken with every stripe locked (a consistent snapshot)."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return sum(self._balances.values())
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
@@ -0,0 +1,123 @@
+"""
+Password policy validation for bulk credential audits.
+
+The rules are the ones from the Week 2 homework solution:
+- at least 8 characters long
+- contains an uppercase letter, a lowercase letter and a digit
+- contains a special character (@, #, $, %)
+
+validate_password() classifies every character once: a 256-byte translation
+table maps each ASCII character to its class code, so one C-level
+bytes.translate() call replaces the original's one Python-level scan per
+rule. Non-ASCII passwords keep the Unicode isupper/islower/isdigit meaning
+of the original checks.
+"""
+
+import string
+from collections import Counter
+
+MIN_LENGTH = 8
+SPECIAL_CHARACTERS = "@#$%"
+
+# Rule messages, in the order the original validator checks them
+TOO_SHORT = "Password too short"
+MISSING_UPPER = "Missing uppercase letter"
+MISSING_LOWER = "Missing lowercase letter"
+MISSING_DIGIT = "Missing digit"
+MISSING_SPECIAL = "Missing special character"
+VALID = "Password is valid"
+
+# One class code per rule - every other byte maps to 0
+_UPPER, _LOWER, _DIGIT, _SPECIAL = b"U", b"L", b"D", b"S"
+_CLASS_TABLE = bytearray(256)
+for _chars, _code in ((string.ascii_uppercase, _UPPER), (string.ascii_lowercase, _LOWER),
+                      (string.digits, _DIGIT), (SPECIAL_CHARACTERS, _SPECIAL)):
+    for _char in _chars:
+        _CLASS_TABLE[ord(_char)] = _code[0]
+_CLASS_TABLE = bytes(_CLASS_TABLE)
+
+
+def _character_classes(password):
+    """Return a bytes string containing the class code of every character."""
+    encoded = password.encode("utf-8", "surrogatepass")
+    classes = encoded.translate(_CLASS_TABLE)
+    if len(encoded) == len(password):
+        return classes
+    # Non-ASCII characters (whose UTF-8 bytes all map to 0) are classified
+    # like the str methods the original rules use
+    extra = bytearray(classes)
+    for char in set(password):
+        if char > "\x7f":
+            if char.isupper():
+                extra += _UPPER
+            if char.islower():
+                extra += _LOWER
+            if char.isdigit():
+                extra += _DIGIT
+    return extra
+
+
+def validate_password(password):
+    """Check every rule and return (is_valid, list of failed rule messages)."""
+    try:
+        failures = [TOO_SHORT] if len(password) < MIN_LENGTH else []
+        classes = _character_classes(password)
+        if _UPPER not in classes:
+            failures.append(MISSING_UPPER)
+        if _LOWER not in classes:
+            failures.append(MISSING_LOWER)
+        if _DIGIT not in classes:
+            failures.append(MISSING_DIGIT)
+        if _SPECIAL not in classes:
+            failures.append(MISSING_SPECIAL)
+        return not failures, failures
+    except Exception as e:
+        return False, [f"Error: {e}"]
+
+
+class PasswordAudit:
+    """Streams validation results while counting how often each rule fails.
+
+        audit = audit_passwords(candidates)
+        for password, failures in audit:
+            ...
+        print(audit.summary())
+
+    Counts are complete once the iteration finishes; use run() to consume
+    everything without looking at individual results.
+    """
+
+    def __init__(self, passwords):
+        self._passwords = passwords
+        self.total = 0
+        self.valid = 0
+        self.failures = Counter()
+
+    def __iter__(self):
+        failures = self.failures
+        for password in self._passwords:
+            is_valid, failed = validate_password(password)
+            self.total += 1
+            if is_valid:
+                self.valid += 1
+            else:
+                failures.update(failed)
+            yield password, failed
+
+    def run(self):
+        for _ in self:
+            pass
+        return self
+
+    def summary(self):
+        return {
+            "total": self.total,
+            "valid": self.valid,
+            "invalid": self.total - self.valid,
+            "failures": dict(self.failures.most_common()),
+        }
+
+
+def audit_passwords(passwords):
+    """Audit an iterable of passwords lazily - see PasswordAudit."""
+    return PasswordAudit(passwords)
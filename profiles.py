@@ -0,0 +1,59 @@
+"""
+Profile rendering for bulk user exports.
+
+create_profile(**info) in Week 2 builds its text with `profile += ...` in a
+loop. Here each distinct set of keys gets a template compiled once (the
+title-cased labels are worked out a single time), and a profile is
+produced with one str.format call. render_profiles() streams any number
+of profiles to a file through a bounded buffer.
+
+    render_profile({"name": "John", "age": 30})
+    -> "User Profile:\\n  Name: John\\n  Age: 30\\n"
+"""
+
+import sys
+from functools import lru_cache
+
+HEADER = "User Profile:\n"
+
+# Profiles collected before each write to the output file
+FLUSH_EVERY = 4096
+
+# How many distinct key layouts keep a compiled template
+TEMPLATE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(keys):
+    """Return a format string for a tuple of keys, in order."""
+    lines = [HEADER.replace("{", "{{").replace("}", "}}")]
+    for position, key in enumerate(keys):
+        label = key.title().replace("{", "{{").replace("}", "}}")
+        lines.append(f"  {label}: {{{position}}}\n")
+    return "".join(lines)
+
+
+def render_profile(info):
+    """The same text create_profile(**info) returns."""
+    return compile_template(tuple(info)).format(*info.values())
+
+
+def render_profiles(profiles, file=None, flush_every=FLUSH_EVERY):
+    """Write one rendered profile per dict in `profiles` to file (stdout by default).
+
+    At most flush_every profiles are held in memory at a time. Returns
+    the number of profiles written.
+    """
+    file = sys.stdout if file is None else file
+    buffer = []
+    written = 0
+    for info in profiles:
+        buffer.append(compile_template(tuple(info)).format(*info.values()))
+        if len(buffer) >= flush_every:
+            file.write("".join(buffer))
+            written += len(buffer)
+            buffer.clear()
+    if buffer:
+        file.write("".join(buffer))
+        written += len(buffer)
+    return written
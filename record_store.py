@@ -0,0 +1,292 @@
+"""
+In-memory record store with secondary indexes, for the Week 3 Library
+and contact manager exercises.
+
+The exercises store books or contacts in a list or dict and search with
+a loop over every record. IndexedStore keeps records in a dict by
+primary key and maintains these indexes on every add, update and remove:
+
+- hash indexes (exact, case-insensitive match, e.g. books by author)
+- sorted indexes (range queries with bisect, e.g. books from 1990-1999)
+- prefix indexes (case-insensitive "starts with", for autocomplete)
+
+    library = Library()
+    library.add(Book(1, "Dune", "Frank Herbert", 1965))
+    library.by_author("frank herbert")
+    library.published_between(1960, 1969)
+    library.autocomplete("du")
+
+Change records through update(), not by assigning to their attributes,
+so the indexes stay in step.
+"""
+
+import csv
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from dataclasses import astuple, dataclass, fields, replace
+
+# Sorts after every character, so text + _MAX_CHAR bounds all keys starting with text
+_MAX_CHAR = "\U0010ffff"
+
+
+def _normalize(value):
+    return value.casefold() if isinstance(value, str) else value
+
+
+class SortedIndex:
+    """Record IDs grouped by key, with the distinct keys kept sorted for bisect.
+
+    Grouping keeps adds and removes cheap when many records share a key
+    (e.g. a year): only a new or vanished key touches the sorted list.
+    """
+
+    def __init__(self):
+        self._keys = []  # distinct keys, sorted
+        self._ids = {}  # key -> list of record IDs, in the order they were added
+
+    def __len__(self):
+        return sum(map(len, self._ids.values()))
+
+    def add(self, key, record_id):
+        ids = self._ids.get(key)
+        if ids is None:
+            insort(self._keys, key)
+            ids = self._ids[key] = []
+        ids.append(record_id)
+
+    def extend(self, pairs):
+        """Add many (key, record_id) pairs, sorting the keys once at the end."""
+        groups = self._ids
+        for key, record_id in pairs:
+            ids = groups.get(key)
+            if ids is None:
+                groups[key] = [record_id]
+            else:
+                ids.append(record_id)
+        if len(groups) != len(self._keys):
+            self._keys = sorted(groups)
+
+    def remove(self, key, record_id):
+        ids = self._ids[key]
+        ids.remove(record_id)
+        if not ids:
+            del self._ids[key]
+            del self._keys[bisect_left(self._keys, key)]
+
+    def _collect(self, start, end, limit):
+        result = []
+        groups, keys = self._ids, self._keys
+        for position in range(start, end):
+            if limit is None:
+                result.extend(groups[keys[position]])
+            else:
+                result.extend(groups[keys[position]][:limit - len(result)])
+                if len(result) == limit:
+                    break
+        return result
+
+    def range(self, low=None, high=None, limit=None):
+        """IDs whose key is between low and high (inclusive; None is unbounded), in key order."""
+        start = 0 if low is None else bisect_left(self._keys, low)
+        end = len(self._keys) if high is None else bisect_right(self._keys, high)
+        return self._collect(start, end, limit)
+
+    def prefix(self, text, limit=None):
+        """IDs whose key starts with text, in key order, at most limit of them."""
+        start = bisect_left(self._keys, text)
+        end = bisect_left(self._keys, text + _MAX_CHAR, start)
+        return self._collect(start, end, limit)
+
+
+class IndexedStore:
+    """Records (dataclass instances) by primary key, plus secondary indexes.
+
+    key names the primary-key attribute. hash_fields, sorted_fields and
+    prefix_fields name the attributes to index; string values are
+    compared case-insensitively in hash and prefix indexes. None values
+    are not indexed.
+    """
+
+    def __init__(self, key, hash_fields=(), sorted_fields=(), prefix_fields=()):
+        self.key = key
+        self._records = {}
+        self._hash = {field: defaultdict(set) for field in hash_fields}
+        self._sorted = {field: SortedIndex() for field in sorted_fields}
+        self._prefix = {field: SortedIndex() for field in prefix_fields}
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, record_id):
+        return record_id in self._records
+
+    def __iter__(self):
+        return iter(self._records.values())
+
+    def get(self, record_id):
+        """The record with this ID; KeyError if there is none."""
+        try:
+            return self._records[record_id]
+        except KeyError:
+            raise KeyError(f"No record with ID {record_id!r}") from None
+
+    def add(self, record):
+        record_id = getattr(record, self.key)
+        if record_id in self._records:
+            raise ValueError(f"A record with ID {record_id!r} already exists")
+        self._records[record_id] = record
+        self._index(record_id, record)
+        return record
+
+    def add_many(self, records):
+        """Add many records, sorting each sorted/prefix index once at the end."""
+        records = list(records)
+        seen = set()
+        for record in records:
+            record_id = getattr(record, self.key)
+            if record_id in self._records or record_id in seen:
+                raise ValueError(f"A record with ID {record_id!r} already exists")
+            seen.add(record_id)
+
+        added = []
+        for record in records:
+            record_id = getattr(record, self.key)
+            self._records[record_id] = record
+            for field, index in self._hash.items():
+                value = getattr(record, field)
+                if value is not None:
+                    index[_normalize(value)].add(record_id)
+            added.append((record_id, record))
+        for field, index in self._sorted.items():
+            index.extend((getattr(record, field), record_id) for record_id, record in added
+                         if getattr(record, field) is not None)
+        for field, index in self._prefix.items():
+            index.extend((_normalize(getattr(record, field)), record_id) for record_id, record in added
+                         if getattr(record, field) is not None)
+        return len(added)
+
+    def update(self, record_id, **changes):
+        """Replace some fields of a record and re-index only the fields that changed."""
+        old = self.get(record_id)
+        if self.key in changes and changes[self.key] != record_id:
+            raise ValueError("The primary key of a record cannot be changed")
+        new = replace(old, **changes)
+        changed = {field for field, value in changes.items() if getattr(old, field) != value}
+        self._unindex(record_id, old, changed)
+        self._records[record_id] = new
+        self._index(record_id, new, changed)
+        return new
+
+    def remove(self, record_id):
+        record = self.get(record_id)
+        self._unindex(record_id, record)
+        del self._records[record_id]
+        return record
+
+    def _index(self, record_id, record, only=None):
+        for field, index in self._hash.items():
+            value = getattr(record, field)
+            if value is not None and (only is None or field in only):
+                index[_normalize(value)].add(record_id)
+        for field, index in self._sorted.items():
+            value = getattr(record, field)
+            if value is not None and (only is None or field in only):
+                index.add(value, record_id)
+        for field, index in self._prefix.items():
+            value = getattr(record, field)
+            if value is not None and (only is None or field in only):
+                index.add(_normalize(value), record_id)
+
+    def _unindex(self, record_id, record, only=None):
+        for field, index in self._hash.items():
+            value = getattr(record, field)
+            if value is not None and (only is None or field in only):
+                key = _normalize(value)
+                ids = index[key]
+                ids.discard(record_id)
+                if not ids:
+                    del index[key]
+        for field, index in self._sorted.items():
+            value = getattr(record, field)
+            if value is not None and (only is None or field in only):
+                index.remove(value, record_id)
+        for field, index in self._prefix.items():
+            value = getattr(record, field)
+            if value is not None and (only is None or field in only):
+                index.remove(_normalize(value), record_id)
+
+    def find(self, field, value):
+        """Records whose field equals value, via its hash index."""
+        ids = self._hash[field].get(_normalize(value), ())
+        return [self._records[record_id] for record_id in ids]
+
+    def range(self, field, low=None, high=None, limit=None):
+        """Records with low <= field <= high, via its sorted index, in field order."""
+        ids = self._sorted[field].range(low, high, limit)
+        return [self._records[record_id] for record_id in ids]
+
+    def prefix(self, field, text, limit=None):
+        """Records whose field starts with text, via its prefix index, in field order."""
+        ids = self._prefix[field].prefix(_normalize(text), limit)
+        return [self._records[record_id] for record_id in ids]
+
+
+# ==============================================
+# LIBRARY AND CONTACT MANAGER
+# ==============================================
+
+@dataclass
+class Book:
+    book_id: int
+    title: str
+    author: str
+    year: int
+
+
+class Library(IndexedStore):
+    """The Week 3 Library exercise: add, remove and search books."""
+
+    def __init__(self, books=()):
+        super().__init__("book_id", hash_fields=("author",), sorted_fields=("year",),
+                         prefix_fields=("title",))
+        self.add_many(books)
+
+    def by_author(self, author):
+        return self.find("author", author)
+
+    def published_between(self, first_year, last_year, limit=None):
+        return self.range("year", first_year, last_year, limit)
+
+    def autocomplete(self, text, limit=10):
+        """Books whose title starts with text, alphabetically."""
+        return self.prefix("title", text, limit)
+
+
+@dataclass
+class Contact:
+    contact_id: int
+    name: str
+    email: str = None
+    phone: str = None
+
+
+class ContactManager(IndexedStore):
+    """The Week 3 contact manager challenge: contacts in a dict by unique ID."""
+
+    def __init__(self, contacts=()):
+        super().__init__("contact_id", hash_fields=("email",), prefix_fields=("name",))
+        self.add_many(contacts)
+
+    def search_by_name(self, text, limit=None):
+        """Contacts whose name starts with text, alphabetically."""
+        return self.prefix("name", text, limit)
+
+    def by_email(self, email):
+        return self.find("email", email)
+
+    def export_csv(self, path):
+        """Write every contact to a CSV file with a header row."""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([field.name for field in fields(Contact)])
+            writer.writerows(astuple(contact) for contact in self)
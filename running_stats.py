@@ -0,0 +1,120 @@
+"""
+Streaming statistics: count, mean, min, max and variance in O(1) memory.
+
+RunningStats replaces calculate_average(*numbers) from Week 2 for data that
+should not be splatted into one tuple. Feed it numbers one at a time,
+iterables, or NumPy array chunks. Partial accumulators from different
+shards or processes can be combined with merge(), using Welford's update
+and Chan et al.'s pairwise formula so the variance stays numerically stable.
+
+    stats = RunningStats()
+    stats.update_many(class_grades)
+    print(stats.mean, stats.min, stats.max)
+"""
+
+import math
+from itertools import islice
+
+# NumPy is optional - everything works with plain Python numbers too
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Values pulled from a plain iterable per NumPy batch
+CHUNK_SIZE = 65536
+
+
+class RunningStats:
+    """Incremental count / mean / min / max / variance accumulator."""
+
+    def __init__(self, values=()):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0  # sum of squared distances from the mean
+        self.min = math.inf
+        self.max = -math.inf
+        self.update_many(values)
+
+    def __repr__(self):
+        return (f"RunningStats(count={self.count}, mean={self.mean}, "
+                f"min={self.min}, max={self.max}, variance={self.variance})")
+
+    def update(self, value):
+        """Add one number (Welford's algorithm)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def update_many(self, values):
+        """Add an iterable or array of numbers."""
+        if np is None:
+            for value in values:
+                self.update(value)
+            return self
+        if isinstance(values, np.ndarray):
+            self._update_array(values)
+            return self
+        iterator = iter(values)
+        while True:
+            chunk = np.fromiter(islice(iterator, CHUNK_SIZE), dtype=np.float64)
+            if not len(chunk):
+                return self
+            self._update_array(chunk)
+
+    def _update_array(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return
+        chunk = RunningStats()
+        chunk.count = len(values)
+        chunk.mean = float(values.mean())
+        chunk._m2 = float(np.square(values - chunk.mean).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Combine another accumulator into this one and return self."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        """Population variance (0 for fewer than two values)."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def sample_variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def summary(self):
+        """Class average, highest and lowest - the Week 2 homework numbers."""
+        return {
+            "count": self.count,
+            "average": self.mean,
+            "highest": self.max if self.count else None,
+            "lowest": self.min if self.count else None,
+            "variance": self.variance,
+        }
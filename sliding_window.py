@@ -0,0 +1,208 @@
+"""
+Rolling aggregates over the most recent values of a stream.
+
+Week 3 lists deque as the structure for queue-like work. Here it backs two
+small components:
+
+- SlidingWindow: sum, mean, min and max over the last `size` values or the
+  last `duration` seconds, each O(1) amortized per value. The sum is kept
+  incrementally. Min and max use monotonic deques: a value that can never
+  be the minimum again (a newer value is smaller) is dropped at once, so
+  the front of the deque is always the answer.
+- BoundedQueue: a FIFO work queue on deque(maxlen=...). When it is full
+  the oldest item is dropped and counted, instead of blocking the producer.
+
+A window can also feed a RunningStats accumulator with every value, so a
+grade or tax stream gets lifetime and recent numbers in one pass:
+
+    recent = SlidingWindow(size=1000, stats=RunningStats())
+    for income in incomes:
+        recent.add(calculate_tax(income))
+    recent.summary()        # the last 1000 taxes
+    recent.stats.summary()  # every tax so far
+"""
+
+import math
+import time
+from collections import deque
+
+
+class SlidingWindow:
+    """Sum / mean / min / max over a count-based or time-based window.
+
+    Give either size (the last `size` values) or duration (values whose
+    timestamp is within `duration` of the newest one). Time windows use
+    the timestamps passed to add(), or clock() when none is given;
+    timestamps must not go backwards. Time windows only move forward on
+    add() or advance().
+    """
+
+    def __init__(self, size=None, duration=None, stats=None, clock=time.monotonic):
+        if (size is None) == (duration is None):
+            raise ValueError("Give exactly one of size and duration")
+        if size is not None and size < 1:
+            raise ValueError("Window size must be at least 1")
+        if duration is not None and duration <= 0:
+            raise ValueError("Window duration must be positive")
+        self.size = size
+        self.duration = duration
+        self.stats = stats
+        self.clock = clock
+        # (position, value) pairs; the position is a sequence number for
+        # count windows and a timestamp for time windows
+        self._values = deque(maxlen=size)
+        self._min = deque()  # increasing values: the front is the minimum
+        self._max = deque()  # decreasing values: the front is the maximum
+        self._seq = 0
+        self._sum = 0.0
+        self._evicted = 0  # values subtracted from _sum since it was last recomputed
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        window = f"size={self.size}" if self.size is not None else f"duration={self.duration}"
+        return f"SlidingWindow({window}, count={len(self)}, mean={self.mean}, min={self.min}, max={self.max})"
+
+    def add(self, value, timestamp=None):
+        """Add one value (at `timestamp` for time windows) and return self."""
+        if self.size is not None:
+            position = self._seq
+            self._seq += 1
+            if len(self._values) == self.size:
+                # deque(maxlen) drops the oldest value on append; keep the sum in step
+                self._sum -= self._values[0][1]
+                self._evicted += 1
+            oldest = position - self.size
+        else:
+            position = self.clock() if timestamp is None else timestamp
+            oldest = position - self.duration
+            self._expire(oldest)
+
+        self._values.append((position, value))
+        self._sum += value
+        minimum = self._min
+        while minimum and minimum[-1][1] >= value:
+            minimum.pop()
+        minimum.append((position, value))
+        maximum = self._max
+        while maximum and maximum[-1][1] <= value:
+            maximum.pop()
+        maximum.append((position, value))
+        if minimum[0][0] <= oldest:
+            minimum.popleft()
+        if maximum[0][0] <= oldest:
+            maximum.popleft()
+
+        if self._evicted > len(self._values):
+            self._resum()
+        if self.stats is not None:
+            self.stats.update(value)
+        return self
+
+    def add_many(self, values, timestamps=None):
+        """Add an iterable of values, with matching timestamps for time windows."""
+        add = self.add
+        if timestamps is None:
+            for value in values:
+                add(value)
+        else:
+            for value, timestamp in zip(values, timestamps):
+                add(value, timestamp)
+        return self
+
+    def advance(self, now=None):
+        """Move a time window to `now` (default clock()), dropping expired values."""
+        if self.duration is None:
+            raise ValueError("Only time windows can be advanced")
+        self._expire((self.clock() if now is None else now) - self.duration)
+        return self
+
+    def _expire(self, oldest):
+        values = self._values
+        while values and values[0][0] <= oldest:
+            self._sum -= values.popleft()[1]
+            self._evicted += 1
+        for extreme in (self._min, self._max):
+            while extreme and extreme[0][0] <= oldest:
+                extreme.popleft()
+        if not values:
+            self._sum = 0.0
+            self._evicted = 0
+
+    def _resum(self):
+        # Adding and subtracting floats drifts; recomputing once per window's
+        # worth of evictions keeps the sum exact at O(1) amortized cost
+        self._sum = math.fsum(value for _, value in self._values)
+        self._evicted = 0
+
+    @property
+    def sum(self):
+        return self._sum
+
+    @property
+    def mean(self):
+        return self._sum / len(self._values) if self._values else 0.0
+
+    @property
+    def min(self):
+        return self._min[0][1] if self._min else None
+
+    @property
+    def max(self):
+        return self._max[0][1] if self._max else None
+
+    def values(self):
+        """The values currently in the window, oldest first."""
+        return [value for _, value in self._values]
+
+    def summary(self):
+        """The same keys as RunningStats.summary(), for the window only."""
+        return {
+            "count": len(self._values),
+            "average": self.mean,
+            "highest": self.max,
+            "lowest": self.min,
+            "sum": self._sum,
+        }
+
+
+class BoundedQueue:
+    """FIFO work queue that drops its oldest item when full."""
+
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("Queue size must be at least 1")
+        self._items = deque(maxlen=maxsize)
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def maxsize(self):
+        return self._items.maxlen
+
+    def full(self):
+        return len(self._items) == self._items.maxlen
+
+    def put(self, item):
+        """Queue an item; returns False if the oldest item had to be dropped for it."""
+        dropped = len(self._items) == self._items.maxlen
+        if dropped:
+            self.dropped += 1
+        self._items.append(item)
+        return not dropped
+
+    def get(self):
+        """Remove and return the oldest item."""
+        if not self._items:
+            raise IndexError("Queue is empty")
+        return self._items.popleft()
+
+    def drain(self, limit=None):
+        """Yield queued items oldest first, at most `limit` of them."""
+        items = self._items
+        count = len(items) if limit is None else min(limit, len(items))
+        for _ in range(count):
+            yield items.popleft()
@@ -0,0 +1,64 @@
+"""
+Bounded memoization for tax lookups.
+
+Income data is heavily quantized (the same salary bands repeat millions of
+times), so remembering recent (schedule, income) -> tax results can skip
+the bracket lookup entirely. The caches are least-recently-used with a
+fixed maximum size, built on functools.lru_cache, and keep
+hit/miss/eviction counters.
+
+For the bundled tax rules it does not pay off: even at a
+100% hit rate, hashing the income and updating the LRU order costs more
+than calculate_tax()'s two comparisons or a TaxSchedule bisect (see
+benchmarks/bench_tax_cache.py). It is only worth enabling when the
+default function or schedule.tax() is expensive to compute.
+"""
+
+from functools import lru_cache
+
+
+def _schedule_tax(schedule, income):
+    return schedule.tax(income)
+
+
+class TaxCache:
+    """LRU caches of tax results, one keyed on income and one on (schedule, income).
+
+    tax(income) memoizes `default` (normally assignment1.calculate_tax);
+    schedule_tax(schedule, income) memoizes schedule.tax(). Both are the
+    lru_cache wrappers themselves, so a hit runs no Python code at all -
+    bind them to a local or module name rather than calling through
+    another function.
+    """
+
+    def __init__(self, default, maxsize=65536):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.default = default
+        self.maxsize = maxsize
+        self.tax = lru_cache(maxsize)(default)
+        self.schedule_tax = lru_cache(maxsize)(_schedule_tax)
+
+    def __len__(self):
+        return self.tax.cache_info().currsize + self.schedule_tax.cache_info().currsize
+
+    def clear(self):
+        """Drop everything and reset the counters - call when a schedule changes."""
+        self.tax.cache_clear()
+        self.schedule_tax.cache_clear()
+
+    def stats(self):
+        infos = [self.tax.cache_info(), self.schedule_tax.cache_info()]
+        hits = sum(info.hits for info in infos)
+        misses = sum(info.misses for info in infos)
+        size = sum(info.currsize for info in infos)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            # Every miss inserts an entry, so whatever is no longer held was evicted
+            "evictions": misses - size,
+            "size": size,
+            "maxsize": self.maxsize,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
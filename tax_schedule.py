@@ -0,0 +1,178 @@
+"""
+Configurable tax bracket schedules.
+
+A bracket table is loaded from a JSON file like this:
+
+    {
+        "mode": "flat",
+        "brackets": [
+            {"rate": 0.0},
+            {"from": 1000, "rate": 0.10},
+            {"above": 5000, "rate": 0.20}
+        ]
+    }
+
+- The first bracket has no threshold and covers everything below the next one.
+- "from" starts a bracket at the threshold itself (income >= threshold).
+- "above" starts a bracket just past the threshold (income > threshold).
+- mode "flat" taxes the whole income at its bracket's rate, like calculate_tax().
+- mode "progressive" taxes each slice of income at its own (marginal) rate.
+
+Schedules are compiled into a sorted threshold array once and cached by
+the SHA-256 of the normalized table (mode defaulted, numbers as floats),
+so the same table is compiled once however it was loaded or written.
+Files also remember their raw-content hash, so reloading one skips the
+JSON parse.
+"""
+
+import bisect
+import hashlib
+import json
+import math
+
+# NumPy is optional - batch lookups fall back to bisect without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MODES = ("flat", "progressive")
+
+# Compiled schedules keyed by content hash
+_SCHEDULE_CACHE = {}
+
+# SHA-256 of a file's raw bytes -> content hash of the table it holds
+_FILE_KEYS = {}
+
+# The bracket fields that change the compiled schedule
+_BRACKET_FIELDS = ("from", "above", "rate")
+
+
+class TaxSchedule:
+    """A compiled bracket table with O(log brackets) lookups."""
+
+    def __init__(self, brackets, mode="flat", key=None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {MODES}")
+        if not brackets:
+            raise ValueError("A schedule needs at least one bracket")
+        if "from" in brackets[0] or "above" in brackets[0]:
+            raise ValueError("The first bracket must not have a threshold")
+
+        thresholds = []
+        for bracket in brackets[1:]:
+            if ("from" in bracket) == ("above" in bracket):
+                raise ValueError(f"Bracket {bracket} needs exactly one of 'from' or 'above'")
+            if "from" in bracket:
+                thresholds.append(float(bracket["from"]))
+            else:
+                # income > t is the same as income >= the next float after t
+                thresholds.append(math.nextafter(float(bracket["above"]), math.inf))
+        if any(b <= a for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError("Bracket thresholds must be strictly increasing")
+
+        self.mode = mode
+        self.brackets = [dict(bracket) for bracket in brackets]
+        self.thresholds = thresholds
+        self.rates = [float(bracket["rate"]) for bracket in brackets]
+        self.key = key or _content_key(brackets, mode)
+
+        # Progressive mode: the bracket's lower bound and the tax owed on
+        # everything below it, so each lookup is base + rate * (income - lower)
+        self.lowers = [0.0] + thresholds
+        self.bases = [0.0]
+        for i, threshold in enumerate(thresholds):
+            self.bases.append(self.bases[-1] + self.rates[i] * (threshold - self.lowers[i]))
+
+        if np is not None:
+            self._np_thresholds = np.array(thresholds, dtype=np.float64)
+            self._np_rates = np.array(self.rates, dtype=np.float64)
+            self._np_lowers = np.array(self.lowers, dtype=np.float64)
+            self._np_bases = np.array(self.bases, dtype=np.float64)
+
+    def __repr__(self):
+        return f"TaxSchedule(mode={self.mode!r}, brackets={len(self.rates)}, key={self.key[:12]!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, TaxSchedule):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def bracket_index(self, income):
+        return bisect.bisect_right(self.thresholds, income)
+
+    def tax(self, income):
+        """Tax for a single income."""
+        index = bisect.bisect_right(self.thresholds, income)
+        rate = self.rates[index]
+        if self.mode == "flat":
+            return income * rate if rate else 0
+        return self.bases[index] + rate * (income - self.lowers[index])
+
+    def tax_batch(self, incomes):
+        """Tax for an array of incomes, using searchsorted when NumPy is present."""
+        if np is None:
+            from array import array
+            return array("d", (self.tax(income) for income in incomes))
+
+        incomes = np.asarray(incomes, dtype=np.float64)
+        index = np.searchsorted(self._np_thresholds, incomes, side="right")
+        rates = self._np_rates[index]
+        if self.mode == "flat":
+            with np.errstate(invalid="ignore"):  # -inf * 0 is reset to 0 below
+                taxes = incomes * rates
+            np.copyto(taxes, 0.0, where=rates == 0)
+            return taxes
+        return self._np_bases[index] + rates * (incomes - self._np_lowers[index])
+
+    @classmethod
+    def from_dict(cls, table):
+        """Compile a {"mode": ..., "brackets": [...]} table, using the cache."""
+        brackets, mode = table["brackets"], table.get("mode", "flat")
+        key = _content_key(brackets, mode)
+        schedule = _SCHEDULE_CACHE.get(key)
+        if schedule is None:
+            schedule = cls(brackets, mode, key=key)
+            _SCHEDULE_CACHE[key] = schedule
+        return schedule
+
+    @classmethod
+    def from_file(cls, path):
+        """Load and compile a JSON bracket file, using the cache."""
+        with open(path, "rb") as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+        schedule = _SCHEDULE_CACHE.get(_FILE_KEYS.get(digest))
+        if schedule is None:
+            schedule = cls.from_dict(json.loads(content))
+            _FILE_KEYS[digest] = schedule.key
+        return schedule
+
+
+def _content_key(brackets, mode="flat"):
+    """SHA-256 of the table with only the fields that affect the tax, as floats."""
+    table = {
+        "mode": mode,
+        "brackets": [{field: float(value) for field, value in bracket.items() if field in _BRACKET_FIELDS}
+                     for bracket in brackets],
+    }
+    content = json.dumps(table, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def clear_schedule_cache():
+    _SCHEDULE_CACHE.clear()
+
+
+# The same brackets as calculate_tax() in assignment1.py
+DEFAULT_SCHEDULE = TaxSchedule.from_dict({
+    "mode": "flat",
+    "brackets": [
+        {"rate": 0.0},
+        {"from": 1000, "rate": 0.10},
+        {"above": 5000, "rate": 0.20},
+    ],
+})
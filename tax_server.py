@@ -0,0 +1,215 @@
+"""
+Tax calculator as a local HTTP/JSON service.
+
+    python tax_server.py --port 8080 --max-batch 512 --max-wait-ms 2
+
+    POST /tax   {"name": "Alice", "income": 4200}
+    ->          {"name": "Alice", "income": 4200.0, "tax": 420.0}
+
+Concurrent requests are coalesced into micro-batches: the first request
+in a batch waits at most --max-wait-ms for others to join, and a batch is
+sent to calculate_tax_batch() as soon as it reaches --max-batch incomes.
+Only the standard library is used (plus NumPy if installed).
+"""
+
+import argparse
+import asyncio
+import json
+import math
+
+from assignment1 import calculate_tax_batch
+
+MAX_BATCH = 512
+MAX_WAIT_MS = 2.0
+
+# Largest request body we accept - one citizen is a few dozen bytes
+MAX_BODY = 64 * 1024
+
+
+class TaxBatcher:
+    """Collects single incomes from many requests and taxes them together."""
+
+    def __init__(self, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.items = 0
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def tax(self, income):
+        """Queue one income and wait for its batch to be computed."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((income, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                # Take whatever is already waiting without yielding
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            taxes = calculate_tax_batch([income for income, _ in batch])
+            for (_, future), tax in zip(batch, taxes.tolist()):
+                if not future.done():
+                    future.set_result(tax)
+            self.batches += 1
+            self.items += len(batch)
+
+
+def parse_citizen(body):
+    """Validate a request body like the interactive loop in assignment1.main()."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise ValueError("Request body must be JSON")
+    if not isinstance(data, dict):
+        raise ValueError("Request body must be a JSON object")
+    try:
+        income = float(data.get("income"))
+    except (TypeError, ValueError):
+        raise ValueError("Please enter a valid number for income.")
+    # float() and json.loads accept NaN and Infinity, which would come back
+    # as NaN/Infinity in the response - not valid JSON for strict clients
+    if not math.isfinite(income):
+        raise ValueError("Please enter a valid number for income.")
+    if income < 0:
+        raise ValueError("Income cannot be negative.")
+    return str(data.get("name", "")), income
+
+
+class TaxServer:
+    """A small HTTP/1.1 server with keep-alive, built on asyncio streams."""
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    await self.reject(writer, 400, "Malformed request line")
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self.reject(writer, 400, "Invalid Content-Length")
+                    break
+                if length > MAX_BODY:
+                    await self.reject(writer, 413, "Request body too large")
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                status, payload = await self.route(method, path, body)
+                self.respond(writer, status, payload, close=not keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method, path, body):
+        if path == "/health":
+            return 200, {"status": "ok", "batches": self.batcher.batches, "items": self.batcher.items}
+        if path != "/tax":
+            return 404, {"error": "Not found"}
+        if method != "POST":
+            return 405, {"error": "Use POST"}
+        try:
+            name, income = parse_citizen(body)
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        tax = await self.batcher.tax(income)
+        return 200, {"name": name, "income": income, "tax": tax}
+
+    async def reject(self, writer, status, error):
+        """Answer a request that cannot be read any further, before closing."""
+        self.respond(writer, status, {"error": error}, close=True)
+        await writer.drain()
+
+    @staticmethod
+    def respond(writer, status, payload, close=False):
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found",
+                   405: "Method Not Allowed", 413: "Payload Too Large"}
+        body = json.dumps(payload).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {reasons[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+
+
+async def serve(host="127.0.0.1", port=8080, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS):
+    batcher = TaxBatcher(max_batch, max_wait_ms)
+    batcher.start()
+    server = await asyncio.start_server(TaxServer(batcher).handle, host, port)
+    print(f"Tax service listening on http://{host}:{port}/tax "
+          f"(max batch {max_batch}, max wait {max_wait_ms} ms)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tax calculator HTTP service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH,
+                        help=f"largest micro-batch (default: {MAX_BATCH})")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS,
+                        help=f"longest a request waits for its batch to fill (default: {MAX_WAIT_MS})")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_batch, args.max_wait_ms))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
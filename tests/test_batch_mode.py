@@ -0,0 +1,52 @@
+"""
+Parallel batch mode must write exactly what process_file writes, also
+when quoted names contain newlines. Run from the repository root:
+    python -m unittest discover tests
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import assignment1
+
+
+class ParallelBatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def read(self, name):
+        with open(self.path(name), newline="", encoding="utf-8") as f:
+            return f.read()
+
+    def assert_parallel_matches(self, rows):
+        with open(self.path("in.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "income"])
+            writer.writerows(rows)
+        expected = assignment1.process_file(self.path("in.csv"), self.path("single.csv"))
+        for workers in (1, 2, 3, 7):
+            with self.subTest(workers=workers):
+                stats = assignment1.process_file_parallel(self.path("in.csv"), self.path("parallel.csv"), workers)
+                self.assertEqual(stats, expected)
+                self.assertEqual(self.read("parallel.csv"), self.read("single.csv"))
+
+    def test_names_with_newlines(self):
+        self.assert_parallel_matches([(f"line one {i}\nline two", 1000 + i) for i in range(400)])
+
+    def test_names_with_quotes_and_commas(self):
+        names = ['say "hi"', "Smith, Jo", '"quoted"\n"twice"', 'a""b', "plain"]
+        self.assert_parallel_matches([(names[i % len(names)] + f" {i}", i * 37 % 20000) for i in range(500)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+TransferProcessor must keep draining its queues when callbacks or the
+account factory raise. Run from the repository root:
+    python -m unittest discover tests
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transfer_processor import TransferProcessor, feed_file
+from week3_data_structures_oop import BankAccount
+
+# Submitting and stopping must finish well within this many seconds
+TIMEOUT = 5
+
+
+def run_events(processor, events):
+    async def feed():
+        processor.start()
+        for event in events:
+            await processor.submit(event)
+        await processor.stop()
+        return processor
+
+    async def feed_with_timeout():
+        return await asyncio.wait_for(feed(), TIMEOUT)
+
+    return asyncio.run(feed_with_timeout())
+
+
+class TransferProcessorErrorTests(unittest.TestCase):
+
+    def test_raising_on_reject_does_not_hang_stop(self):
+        calls = []
+
+        def on_reject(event, reason):
+            calls.append(reason)
+            raise RuntimeError("reporter is broken")
+
+        accounts = {"alice": BankAccount("alice", 10)}
+        events = [{"account": "alice", "type": "withdraw", "amount": 100}] * 3
+        processor = run_events(TransferProcessor(accounts, workers=2, on_reject=on_reject), events)
+
+        self.assertEqual(calls, ["Insufficient funds"] * 3)
+        self.assertEqual(processor.rejected, 3)
+        self.assertEqual(processor.reporter_errors, 3)
+        self.assertEqual(accounts["alice"].get_balance(), 10)
+
+    def test_raising_account_factory_does_not_kill_worker(self):
+        rejected = []
+
+        def factory(account_id):
+            raise RuntimeError(f"cannot open {account_id}")
+
+        accounts = {"alice": BankAccount("alice", 0)}
+        # One worker and a tiny queue: a dead worker would block submit()
+        events = [{"account": f"new-{i}", "type": "deposit", "amount": 1} for i in range(5)]
+        events += [{"account": "alice", "type": "deposit", "amount": 5}] * 4
+        processor = TransferProcessor(accounts, workers=1, queue_size=2, account_factory=factory,
+                                      on_reject=lambda event, reason: rejected.append(reason))
+        processor = run_events(processor, events)
+
+        self.assertEqual(processor.processed, 4)
+        self.assertEqual(processor.rejected, 5)
+        self.assertEqual(processor.errors, 5)
+        self.assertEqual(rejected[0], "RuntimeError: cannot open new-0")
+        self.assertEqual(accounts["alice"].get_balance(), 20)
+
+    def test_feed_file_skips_malformed_lines(self):
+        lines = ['{"account": "alice", "type": "deposit", "amount": 5}', "not json", "[1, 2]", "",
+                 '{"account": "alice", "type": "deposit", "amount": 7}']
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False, encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self.addCleanup(os.remove, f.name)
+
+        accounts = {"alice": BankAccount("alice", 0)}
+        processor = TransferProcessor(accounts, workers=1)
+
+        async def feed():
+            processor.start()
+            await feed_file(processor, f.name)
+            await processor.stop()
+
+        errors = io.StringIO()
+        with contextlib.redirect_stderr(errors):
+            asyncio.run(asyncio.wait_for(feed(), TIMEOUT))
+
+        self.assertEqual(processor.processed, 2)
+        self.assertEqual(accounts["alice"].get_balance(), 12)
+        self.assertIn("line 2", errors.getvalue())
+        self.assertIn("line 3", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
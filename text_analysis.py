@@ -0,0 +1,230 @@
+"""
+Streaming text analysis for corpora too big to hold in memory.
+
+analyze_stream() gives the same result dict as analyze_text() in
+week2_control_flow_functions.py, but reads its input in fixed-size chunks
+(through mmap for files) and counts characters, words, sentences and
+letter frequencies in a single pass with constant memory.
+
+TextCounter holds the partial counts. Counters for consecutive pieces of
+text can be merged, which is what the parallel mode builds on:
+analyze_corpus() maps files (and byte ranges of big files) over a process
+pool and reduces the partial counters in order, so the result is exact.
+"""
+
+import codecs
+import mmap
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Bytes (or characters) read per chunk
+CHUNK_SIZE = 1 << 20
+
+SENTENCE_ENDINGS = (".", "!", "?")
+
+
+class TextCounter:
+    """Partial counts for one stretch of text."""
+
+    def __init__(self):
+        self.characters = 0
+        self.words = 0
+        self.sentences = 0
+        # Letter -> count, in order of first appearance (max() picks the first on ties)
+        self.letters = {}
+        # Whether the text starts / ends inside a word, so that a word cut
+        # in two by a chunk boundary is only counted once
+        self.starts_in_word = False
+        self.ends_in_word = False
+
+    def feed(self, chunk):
+        """Count the next chunk of text."""
+        if not chunk:
+            return
+        if self.characters == 0:
+            self.starts_in_word = not chunk[0].isspace()
+
+        words = len(chunk.split())
+        if self.ends_in_word and not chunk[0].isspace():
+            words -= 1  # the first word continues the last one
+        self.words += words
+        self.ends_in_word = not chunk[-1].isspace()
+
+        self.characters += len(chunk)
+        self.sentences += sum(chunk.count(ending) for ending in SENTENCE_ENDINGS)
+
+        letters = self.letters
+        for char, count in Counter(chunk.lower()).items():
+            if char.isalpha():
+                letters[char] = letters.get(char, 0) + count
+
+    def merge(self, other, contiguous=True):
+        """Add the counts of the text that follows this one.
+
+        With contiguous=False (separate files) a word at the end of this
+        text and one at the start of the other are counted separately.
+        """
+        if other.characters == 0:
+            return self
+        if self.characters == 0:
+            self.starts_in_word = other.starts_in_word
+        words = other.words
+        if contiguous and self.ends_in_word and other.starts_in_word:
+            words -= 1
+        self.words += words
+        self.ends_in_word = other.ends_in_word
+        self.characters += other.characters
+        self.sentences += other.sentences
+        for char, count in other.letters.items():
+            self.letters[char] = self.letters.get(char, 0) + count
+        return self
+
+    def result(self):
+        """The analyze_text() result dict for everything counted so far."""
+        if self.letters:
+            most_common = max(self.letters.items(), key=lambda x: x[1])
+        else:
+            most_common = ("None", 0)
+        return {
+            "characters": self.characters,
+            "words": self.words,
+            "sentences": self.sentences,
+            "most_common_letter": most_common[0],
+            "letter_frequency": most_common[1],
+        }
+
+
+def iter_file_chunks(path, chunk_size=CHUNK_SIZE, start=0, end=None, encoding="utf-8"):
+    """Yield decoded text chunks of a file (or of bytes [start, end)) via mmap.
+
+    Multi-byte characters cut by a chunk boundary are carried over by an
+    incremental decoder.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if end <= start:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset in range(start, end, chunk_size):
+                text = decoder.decode(mapped[offset:min(offset + chunk_size, end)])
+                if text:
+                    yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def _iter_chunks(source, chunk_size):
+    if isinstance(source, (str, os.PathLike)):
+        yield from iter_file_chunks(source, chunk_size)
+    elif hasattr(source, "read"):
+        decoder = None
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            if isinstance(chunk, bytes):
+                decoder = decoder or codecs.getincrementaldecoder("utf-8")()
+                chunk = decoder.decode(chunk)
+            yield chunk
+        if decoder is not None:
+            yield decoder.decode(b"", final=True)
+    else:
+        yield from source
+
+
+def analyze_stream(source, chunk_size=CHUNK_SIZE):
+    """Analyze a file path, an open file, or an iterable of text chunks.
+
+    A str is treated as a file path - use analyze_text() for literal text.
+    """
+    try:
+        counter = TextCounter()
+        for chunk in _iter_chunks(source, chunk_size):
+            if not isinstance(chunk, str):
+                raise TypeError("Input must be a string")
+            counter.feed(chunk)
+        return counter.result()
+    except Exception as e:
+        return {"error": str(e)}
+
+
+# ==============================================
+# PARALLEL MAP-REDUCE OVER A CORPUS
+# ==============================================
+
+# Shards per worker - more shards than workers keeps every core busy
+SHARDS_PER_WORKER = 4
+
+# Never split a file into shards smaller than this
+MIN_SHARD_SIZE = 4 * CHUNK_SIZE
+
+
+def corpus_files(source):
+    """A directory (walked in sorted order), a single path, or a list of paths."""
+    if isinstance(source, (str, os.PathLike)):
+        if not os.path.isdir(source):
+            return [os.fspath(source)]
+        paths = []
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            paths.extend(os.path.join(root, name) for name in sorted(files))
+        return paths
+    return [os.fspath(path) for path in source]
+
+
+def _char_boundary(f, offset):
+    """Move offset forward past UTF-8 continuation bytes."""
+    f.seek(offset)
+    while True:
+        byte = f.read(1)
+        if not byte or byte[0] & 0xC0 != 0x80:
+            return offset
+        offset += 1
+
+
+def plan_shards(paths, shards):
+    """Split files into (path, start, end) byte ranges of roughly equal size."""
+    sizes = [os.path.getsize(path) for path in paths]
+    target = max(MIN_SHARD_SIZE, sum(sizes) // max(1, shards))
+    plan = []
+    for path, size in zip(paths, sizes):
+        pieces = max(1, size // target)
+        offsets = [0]
+        with open(path, "rb") as f:
+            for i in range(1, pieces):
+                offsets.append(max(_char_boundary(f, size * i // pieces), offsets[-1]))
+        offsets.append(size)
+        plan.extend((path, start, end) for start, end in zip(offsets, offsets[1:]))
+    return plan
+
+
+def count_shard(path, start, end, chunk_size=CHUNK_SIZE):
+    """Map step: count one byte range of one file."""
+    counter = TextCounter()
+    for chunk in iter_file_chunks(path, chunk_size, start, end):
+        counter.feed(chunk)
+    return counter
+
+
+def analyze_corpus(source, workers=None, chunk_size=CHUNK_SIZE):
+    """Analyze every file of a corpus across a process pool.
+
+    Each file is treated as a separate document: words never join across
+    files. Partial counters are reduced in corpus order, so every count,
+    including most_common_letter and its tie-breaking, is exact.
+    """
+    workers = workers or os.cpu_count() or 1
+    plan = plan_shards(corpus_files(source), workers * SHARDS_PER_WORKER)
+
+    total = TextCounter()
+    previous_path = None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(count_shard, path, start, end, chunk_size) for path, start, end in plan]
+        for (path, _, _), future in zip(plan, futures):
+            total.merge(future.result(), contiguous=path == previous_path)
+            previous_path = path
+    return total.result()
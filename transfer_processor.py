@@ -0,0 +1,252 @@
+"""
+Asyncio pipeline that feeds BankAccount.deposit / withdraw from an event stream.
+
+Events are JSON lines such as
+    {"account": "alice", "type": "deposit", "amount": 50}
+    {"account": "alice", "type": "withdraw", "amount": 20}
+read from a file or a local socket.
+
+- Backpressure: each worker has a bounded asyncio.Queue, so a producer
+  waits whenever the workers fall behind.
+- Ordering: an account always hashes to the same worker, which handles
+  its events one by one, so events for one account apply in arrival order.
+  Different accounts are processed concurrently by different workers.
+- Rejections ("Insufficient funds", bad amounts, unknown accounts) go to a
+  separate reporter task and never stall the workers.
+- stop() stops accepting events, drains every queue, then shuts down.
+
+Usage:
+    python transfer_processor.py --file events.jsonl
+    python transfer_processor.py --port 9000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from running_stats import RunningStats
+
+WORKERS = 8
+QUEUE_SIZE = 1024
+
+
+class TransferProcessor:
+    """Applies deposit/withdraw events to accounts with per-account ordering."""
+
+    def __init__(self, accounts, workers=WORKERS, queue_size=QUEUE_SIZE,
+                 account_factory=None, on_reject=None):
+        self.accounts = accounts
+        self.account_factory = account_factory
+        self.on_reject = on_reject
+        self._queues = [asyncio.Queue(maxsize=queue_size) for _ in range(workers)]
+        self._rejections = asyncio.Queue()
+        self._tasks = []
+        self._accepting = False
+
+        # Metrics
+        self.processed = 0
+        self.rejected = 0
+        self.errors = 0  # rejections caused by unexpected exceptions
+        self.reporter_errors = 0  # on_reject calls that raised
+        self.max_queue_depth = 0
+        self.latency = RunningStats()
+        self._started_at = None
+
+    def start(self):
+        self._accepting = True
+        self._started_at = time.perf_counter()
+        self._tasks = [asyncio.create_task(self._worker(queue)) for queue in self._queues]
+        self._reporter = asyncio.create_task(self._report_rejections())
+
+    async def submit(self, event):
+        """Queue one event, waiting while its worker's queue is full."""
+        if not self._accepting:
+            raise RuntimeError("Processor is not accepting events")
+        try:
+            index = hash(event.get("account")) % len(self._queues)
+        except TypeError:
+            index = 0  # unhashable ID - the worker will reject it
+        queue = self._queues[index]
+        await queue.put((event, time.perf_counter()))
+        depth = self.queue_depth()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def queue_depth(self):
+        return sum(queue.qsize() for queue in self._queues)
+
+    async def _worker(self, queue):
+        while True:
+            event, queued_at = await queue.get()
+            try:
+                self._apply(event)
+                self.processed += 1
+            except (KeyError, TypeError, ValueError) as e:
+                self.rejected += 1
+                self._rejections.put_nowait((event, str(e.args[0]) if e.args else str(e)))
+            except Exception as e:
+                # Anything else (a failing account_factory, a bug in an
+                # account class) must not kill the worker and strand its queue
+                self.rejected += 1
+                self.errors += 1
+                self._rejections.put_nowait((event, f"{type(e).__name__}: {e}"))
+            finally:
+                self.latency.update(time.perf_counter() - queued_at)
+                queue.task_done()
+            # Let other workers and producers run between events
+            await asyncio.sleep(0)
+
+    def _apply(self, event):
+        account_id = event.get("account")
+        account = self.accounts.get(account_id)
+        if account is None:
+            if self.account_factory is None:
+                raise KeyError(f"Unknown account {account_id!r}")
+            account = self.accounts[account_id] = self.account_factory(account_id)
+        kind = event.get("type")
+        amount = event.get("amount")
+        if kind == "deposit":
+            account.deposit(amount)
+        elif kind == "withdraw":
+            account.withdraw(amount)
+        else:
+            raise ValueError(f"Unknown event type {kind!r}")
+
+    async def _report_rejections(self):
+        while True:
+            event, reason = await self._rejections.get()
+            try:
+                if self.on_reject is not None:
+                    result = self.on_reject(event, reason)
+                    if asyncio.iscoroutine(result):
+                        await result
+            except Exception as e:
+                # A failing callback must not stop later rejections being reported
+                self.reporter_errors += 1
+                print(f"on_reject failed for {event}: {e!r}", file=sys.stderr)
+            finally:
+                self._rejections.task_done()
+
+    async def stop(self):
+        """Stop accepting events, finish everything queued, then shut down."""
+        self._accepting = False
+        for queue in self._queues:
+            await queue.join()
+        await self._rejections.join()
+        for task in self._tasks + [self._reporter]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, self._reporter, return_exceptions=True)
+
+    def metrics(self):
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        handled = self.processed + self.rejected
+        return {
+            "processed": self.processed,
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "reporter_errors": self.reporter_errors,
+            "queue_depth": self.queue_depth(),
+            "max_queue_depth": self.max_queue_depth,
+            "throughput_per_sec": handled / elapsed if elapsed else 0.0,
+            "mean_latency_ms": self.latency.mean * 1000,
+            "max_latency_ms": self.latency.max * 1000 if self.latency.count else 0.0,
+        }
+
+
+def parse_event(line):
+    """Decode one JSON line; blank lines give None."""
+    line = line.strip()
+    if not line:
+        return None
+    event = json.loads(line)
+    if not isinstance(event, dict):
+        raise ValueError("Event must be a JSON object")
+    return event
+
+
+async def feed_file(processor, path):
+    """Submit every event in a JSON-lines file, in order, skipping bad lines."""
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            try:
+                event = parse_event(line)
+            except ValueError as e:
+                print(f"Skipping bad event on line {number}: {e}", file=sys.stderr)
+                continue
+            if event is not None:
+                await processor.submit(event)
+
+
+async def feed_socket(processor, host, port, stop_event):
+    """Accept JSON-lines connections until stop_event is set."""
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    event = parse_event(line.decode("utf-8"))
+                except ValueError as e:
+                    print(f"Skipping bad event: {e}", file=sys.stderr)
+                    continue
+                if event is not None:
+                    await processor.submit(event)
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    async with server:
+        await stop_event.wait()
+
+
+async def run(args):
+    # Imported here so that using TransferProcessor does not load the lesson
+    from week3_data_structures_oop import BankAccount
+
+    accounts = {}
+
+    def report(event, reason):
+        print(f"Rejected {event}: {reason}", file=sys.stderr)
+
+    processor = TransferProcessor(
+        accounts, workers=args.workers, queue_size=args.queue_size,
+        account_factory=lambda account_id: BankAccount(account_id, args.opening_balance),
+        on_reject=report,
+    )
+    processor.start()
+    try:
+        if args.file:
+            await feed_file(processor, args.file)
+        else:
+            stop_event = asyncio.Event()
+            try:
+                await feed_socket(processor, args.host, args.port, stop_event)
+            except asyncio.CancelledError:
+                pass
+    finally:
+        await processor.stop()
+    print(json.dumps(processor.metrics(), indent=2))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply deposit/withdraw events to bank accounts")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", help="JSON-lines file of events")
+    source.add_argument("--port", type=int, help="listen for JSON-lines events on this port")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE)
+    parser.add_argument("--opening-balance", type=float, default=0.0)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
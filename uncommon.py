@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+One command line for the course tools.
+
+    python uncommon.py tax citizens.csv -o taxes.csv
+    python uncommon.py grade scores.txt
+    python uncommon.py text essay.txt
+    python uncommon.py passwords < candidates.txt
+    python uncommon.py fib 10 100 1000
+
+Every subcommand reads a file, or stdin when the input is "-" or left
+out, and writes its results to stdout (or --output) as it goes. The
+module behind a subcommand is imported only when that subcommand runs,
+so `uncommon.py --help` costs little more than argparse itself, however
+many commands are registered.
+"""
+
+import argparse
+import sys
+from itertools import islice
+
+# Input lines handled per batch by the line-oriented commands
+BATCH_SIZE = 10_000
+
+
+def open_input(path, newline=None):
+    """A text file for reading; "-" means stdin."""
+    if path == "-":
+        return _Unclosed(sys.stdin)
+    return open(path, newline=newline, encoding="utf-8")
+
+
+def open_output(path, newline=None):
+    """A text file for writing; "-" means stdout."""
+    if path == "-":
+        return _Unclosed(sys.stdout)
+    return open(path, "w", newline=newline, encoding="utf-8", buffering=1024 * 1024)
+
+
+class _Unclosed:
+    """Lets stdin/stdout be used in a with-block without closing them."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __enter__(self):
+        return self.stream
+
+    def __exit__(self, *exc):
+        if self.stream is sys.stdout:
+            self.stream.flush()
+
+
+def batches(lines, size=BATCH_SIZE):
+    """Yield lists of up to `size` lines with their line endings removed."""
+    lines = iter(lines)
+    while True:
+        batch = [line.rstrip("\r\n") for line in islice(lines, size)]
+        if not batch:
+            return
+        yield batch
+
+
+def write_batch(out_file, lines):
+    """Write one batch of result lines and push it downstream right away."""
+    out_file.write("\n".join(lines))
+    out_file.write("\n")
+    out_file.flush()
+
+
+def io_arguments(parser, input_flag=False):
+    """The input file and --output options every subcommand shares."""
+    if input_flag:
+        parser.add_argument("--input", default="-", help='input file (default: "-", stdin)')
+    else:
+        parser.add_argument("input", nargs="?", default="-", help='input file (default: "-", stdin)')
+    parser.add_argument("-o", "--output", default="-", help='output file (default: "-", stdout)')
+
+
+# ==============================================
+# SUBCOMMANDS - each imports its module when it runs
+# ==============================================
+
+def tax_arguments(parser):
+    io_arguments(parser)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes; needs real input and output files (default: 1)")
+
+
+def run_tax(args):
+    """name,income CSV rows in, name,income,tax CSV rows out."""
+    import assignment1
+
+    if args.workers < 1:
+        raise SystemExit("--workers must be at least 1")
+    if args.workers > 1:
+        if "-" in (args.input, args.output):
+            raise SystemExit("--workers needs --output and an input file, not stdin/stdout")
+        assignment1.run_batch(args.input, args.output, args.workers)
+        return
+    with open_input(args.input, newline="") as in_file, open_output(args.output, newline="") as out_file:
+        out_file.write(assignment1.OUTPUT_HEADER)
+        stats = assignment1.process_lines(in_file, out_file)
+    skipped = stats["skipped"]
+    print(f"Written: {stats['written']:,}  "
+          f"Skipped: {skipped['invalid']:,} invalid, {skipped['negative']:,} negative",
+          file=sys.stderr)
+
+
+def run_grade(args):
+    """One score per line in, the letter grade (or error message) per line out."""
+    import grading
+
+    with open_input(args.input) as in_file, open_output(args.output) as out_file:
+        for batch in batches(in_file):
+            write_batch(out_file, grading.to_messages(grading.grade_batch(batch)))
+
+
+def text_arguments(parser):
+    io_arguments(parser)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="analyze a file or directory across worker processes (default: 1)")
+
+
+def run_text(args):
+    """Character, word and sentence counts of a text, as JSON."""
+    import json
+    import text_analysis
+
+    if args.workers > 1 and args.input != "-":
+        result = text_analysis.analyze_corpus(args.input, args.workers)
+    elif args.input == "-":
+        result = text_analysis.analyze_stream(sys.stdin)
+    else:
+        result = text_analysis.analyze_stream(args.input)
+    with open_output(args.output) as out_file:
+        out_file.write(json.dumps(result) + "\n")
+
+
+def passwords_arguments(parser):
+    io_arguments(parser)
+    parser.add_argument("--summary", action="store_true",
+                        help="print how often each rule failed to stderr at the end")
+
+
+def run_passwords(args):
+    """One password per line in, "password<TAB>result" per line out."""
+    import json
+    import passwords
+
+    with open_input(args.input) as in_file, open_output(args.output) as out_file:
+        audit = passwords.audit_passwords(line for batch in batches(in_file) for line in batch)
+        results = (f"{password}\t{'; '.join(failed) or passwords.VALID}" for password, failed in audit)
+        while True:
+            batch = list(islice(results, BATCH_SIZE))
+            if not batch:
+                break
+            write_batch(out_file, batch)
+    if args.summary:
+        print(json.dumps(audit.summary()), file=sys.stderr)
+
+
+def fib_index(text):
+    """argparse type for a Fibonacci index: a non-negative integer."""
+    try:
+        n = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid index: {text!r}") from None
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"index must not be negative: {n}")
+    return n
+
+
+def fib_arguments(parser):
+    # The positional arguments are indices, so the input file is a flag here
+    io_arguments(parser, input_flag=True)
+    choice = parser.add_mutually_exclusive_group()
+    choice.add_argument("n", nargs="*", type=fib_index, default=[],
+                        help="indices to compute; read one per line from the input if none are given")
+    choice.add_argument("--limit", type=int,
+                        help="instead, list every Fibonacci number up to LIMIT")
+
+
+def fib_line(line, fib):
+    """F(n) for the index on one input line, or an error message for a bad index."""
+    try:
+        return str(fib(fib_index(line.strip())))
+    except argparse.ArgumentTypeError as e:
+        return f"Error: {e}"
+
+
+def run_fib(args):
+    """F(n) for each index n, one per line."""
+    import fibonacci
+
+    # F(n) passes Python's default 4300-digit str() limit at n = 20,000 or so
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+
+    with open_output(args.output) as out_file:
+        if args.limit is not None:
+            numbers = map(str, fibonacci.fibonacci_numbers(args.limit))
+            for batch in iter(lambda: list(islice(numbers, BATCH_SIZE)), []):
+                write_batch(out_file, batch)
+        elif args.n:
+            write_batch(out_file, [str(fibonacci.cached_fib(n)) for n in args.n])
+        else:
+            with open_input(args.input) as in_file:
+                for batch in batches(in_file):
+                    write_batch(out_file, [fib_line(n, fibonacci.cached_fib) for n in batch if n.strip()])
+
+
+# name -> (help, adds the arguments, handler). Handlers import their module
+# themselves; nothing here may import a lesson module at startup.
+COMMANDS = {
+    "tax": ("tax a CSV of name,income rows", tax_arguments, run_tax),
+    "grade": ("letter-grade one score per line", io_arguments, run_grade),
+    "text": ("count characters, words and sentences", text_arguments, run_text),
+    "passwords": ("check one password per line against the rules", passwords_arguments, run_passwords),
+    "fib": ("Fibonacci numbers at any index", fib_arguments, run_fib),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="uncommon", description="UnCommon Mentorship course tools")
+    subparsers = parser.add_subparsers(dest="command", metavar="command", required=True)
+    for name, (help_text, add_arguments, handler) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text, description=handler.__doc__)
+        add_arguments(sub)
+        sub.set_defaults(handler=handler)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        args.handler(args)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`) - stop quietly, and keep the
+        # interpreter from complaining when it flushes stdout on exit
+        import os
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
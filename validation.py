@@ -0,0 +1,252 @@
+"""
+Schema-driven bulk validation of numeric form fields.
+
+get_user_age() in Week 2 parses each value with int() inside try/except
+and tells errors apart by looking for "invalid literal" in the exception
+message. For columns of millions of strings this module instead:
+
+- converts the column in C with array.extend(map(int, ...)) and
+  range-checks each converted run with min() and max() before looking
+  at single rows
+- validates the rows int()/float() reject one at a time, checking their
+  shape with cheap str methods (and a precompiled regex for floats);
+  where bad rows are dense, whole stretches go this way so they do not
+  each cost an exception
+- returns a structured error code per row in a bytearray, plus a compact
+  array of parsed values, instead of raising or printing
+
+    schema = {"age": AGE_RULE, "income": INCOME_RULE}
+    results = validate_columns({"age": ages, "income": incomes}, schema)
+    results["age"].codes[i]      # OK, NOT_A_NUMBER, BELOW_MIN or ABOVE_MAX
+    results["age"].values[i]     # parsed value (0 when the code is not OK)
+"""
+
+import math
+import re
+from array import array
+from collections import namedtuple
+from itertools import chain, islice
+
+# Error codes
+OK = 0
+NOT_A_NUMBER = 1
+BELOW_MIN = 2
+ABOVE_MAX = 3
+
+ColumnResult = namedtuple("ColumnResult", ["values", "codes"])
+
+# After convert() rejects a row, the next rows are validated one at a time.
+# That stretch doubles (up to MAX_STRETCH rows) while bulk runs stay shorter
+# than SHORT_RUN rows - too short to be worth an exception each
+SHORT_RUN = 32
+MAX_STRETCH = 256
+
+# What float() accepts in the common case: digits, optional point and exponent
+_FLOAT_SHAPE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_FLOAT_WORDS = {"inf", "infinity", "nan"}
+
+
+def _parse_int(text):
+    """int(text) without raising - returns None if int() would reject it."""
+    stripped = text.strip()
+    digits = stripped[1:] if stripped[:1] in ("+", "-") else stripped
+    if digits.isdecimal():
+        return int(stripped)
+    if "_" in digits:
+        # Rare: int() allows underscores between digits
+        try:
+            return int(stripped)
+        except ValueError:
+            return None
+    return None
+
+
+def _parse_float(text):
+    """float(text) without raising - returns None if float() would reject it."""
+    stripped = text.strip()
+    if _FLOAT_SHAPE.fullmatch(stripped) or stripped.lstrip("+-").lower() in _FLOAT_WORDS:
+        return float(stripped)
+    if "_" in stripped or not stripped.isascii():
+        # Rare: underscores or non-ASCII digits - let float() decide
+        try:
+            return float(stripped)
+        except ValueError:
+            return None
+    return None
+
+
+def _check_range(values, codes, start, low, high):
+    """Code and zero the out-of-range values from values[start:] on."""
+    span = values[start:]
+    if not span:
+        return
+    # NaN compares False both ways, so it passes as in the per-row check;
+    # min() and max() only return NaN when it is the first value
+    lowest, highest = min(span), max(span)
+    if lowest < low or highest > high or lowest != lowest:
+        for index, value in enumerate(span, start):
+            if value < low:
+                codes[index] = BELOW_MIN
+                values[index] = 0
+            elif value > high:
+                codes[index] = ABOVE_MAX
+                values[index] = 0
+
+
+class NumberRule:
+    """A numeric field with optional inclusive bounds and per-error messages.
+
+    Values are parsed like float() unless a subclass says otherwise.
+    """
+
+    typecode = "d"
+    convert = float
+    # Range the typecode can store; None means unlimited
+    type_min = None
+    type_max = None
+
+    def __init__(self, min_value=None, max_value=None, messages=None):
+        self.min_value = min_value
+        self.max_value = max_value
+        # Bounds actually enforced: the given ones, narrowed to what the
+        # values array can hold so an oversized row gets a code, not an error
+        self._low = self._narrow(min_value, self.type_min, max)
+        self._high = self._narrow(max_value, self.type_max, min)
+        self.messages = {
+            NOT_A_NUMBER: "Please enter a valid number",
+            BELOW_MIN: f"Value must be at least {self._low}",
+            ABOVE_MAX: f"Value must be at most {self._high}",
+        }
+        self.messages.update(messages or {})
+
+    @staticmethod
+    def _narrow(bound, limit, pick):
+        if bound is None or limit is None:
+            return limit if bound is None else bound
+        return pick(bound, limit)
+
+    def fast_check(self, text):
+        """True if text is certainly valid for convert() - a cheap shortcut."""
+        return False
+
+    def parse(self, text):
+        """Parse a string, returning None instead of raising when it is invalid."""
+        return _parse_float(text)
+
+    def validate_column(self, strings):
+        """Validate a column of strings; returns ColumnResult(values, codes).
+
+        convert() runs over the column in C until it rejects a row. That
+        row is validated on its own, followed by a stretch of rows done one
+        at a time, which doubles while rejections stay close together, so
+        columns with many bad rows do not pay for an exception on each.
+        """
+        if not isinstance(strings, (list, tuple)):
+            strings = list(strings)
+        count = len(strings)
+        values = []
+        codes = bytearray(count)
+        convert = self.convert
+        low = -math.inf if self._low is None else self._low
+        high = math.inf if self._high is None else self._high
+        rows = iter(strings)
+        stretch = 1
+        while True:
+            start = len(values)
+            try:
+                # str.strip rejects non-strings, which convert() might accept
+                values.extend(map(convert, map(str.strip, rows)))
+                rejected = False
+            except (TypeError, ValueError):
+                rejected = True
+            _check_range(values, codes, start, low, high)
+            if not rejected:
+                break
+            # values holds every row before the rejected one, which rows has consumed
+            converted = len(values) - start
+            stretch = min(stretch * 2, MAX_STRETCH) if converted < SHORT_RUN else 1
+            self._validate_rows(chain((strings[len(values)],), islice(rows, stretch - 1)),
+                                values, codes, low, high)
+            if len(values) == count:
+                break
+        # Out-of-range values are zeroed by now, so all of them fit the typecode
+        return ColumnResult(array(self.typecode, values), codes)
+
+    def _validate_rows(self, texts, values, codes, low, high):
+        """Validate rows one at a time, extending values and setting codes."""
+        parse = self.parse
+        fast = self.fast_check
+        convert = self.convert
+        append = values.append
+        start = len(values)
+        stretch_codes = bytearray()
+        for text in texts:
+            # Plain digits (the common case) skip the full parser
+            if text.__class__ is str and fast(text):
+                value = convert(text)
+            elif isinstance(text, str):
+                value = parse(text)
+            else:
+                value = None
+            if value is None:
+                code, value = NOT_A_NUMBER, 0
+            elif value < low:
+                code, value = BELOW_MIN, 0
+            elif value > high:
+                code, value = ABOVE_MAX, 0
+            else:
+                code = OK
+            append(value)
+            stretch_codes.append(code)
+        codes[start:start + len(stretch_codes)] = stretch_codes
+
+    def validate(self, text):
+        """Validate one string; returns (value or None, code)."""
+        result = self.validate_column([text])
+        code = result.codes[0]
+        return (result.values[0] if code == OK else None), code
+
+
+class IntRule(NumberRule):
+    """Whole numbers, parsed like int()."""
+
+    typecode = "q"
+    type_min = -(1 << 63)
+    type_max = (1 << 63) - 1
+    fast_check = staticmethod(str.isdecimal)
+    convert = int
+
+    def parse(self, text):
+        return _parse_int(text)
+
+
+class FloatRule(NumberRule):
+    """Decimal numbers, parsed like float().
+
+    As in assignment1.main(), "nan" passes a minimum check because NaN
+    compares False with everything.
+    """
+
+    typecode = "d"
+    convert = float
+
+    @staticmethod
+    def fast_check(text):
+        return text.replace(".", "", 1).isdecimal()
+
+
+# The rules used by the lessons
+AGE_RULE = IntRule(0, 150, messages={BELOW_MIN: "Age cannot be negative",
+                                     ABOVE_MAX: "Age seems unrealistic"})
+INCOME_RULE = FloatRule(min_value=0, messages={NOT_A_NUMBER: "Please enter a valid number for income.",
+                                               BELOW_MIN: "Income cannot be negative."})
+
+
+def validate_columns(columns, schema):
+    """Validate each column named in schema; returns {name: ColumnResult}."""
+    return {name: rule.validate_column(columns[name]) for name, rule in schema.items()}
+
+
+def error_counts(result):
+    """How many rows got each error code."""
+    return {code: result.codes.count(code) for code in (OK, NOT_A_NUMBER, BELOW_MIN, ABOVE_MAX)}
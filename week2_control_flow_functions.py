@@ -12,230 +12,235 @@ This file contains practical examples and exercises for Week 2 topics:
 - Error handling basics (try/except)
 """
 
-print("🐍 Week 2: Control Flow and Functions")
-print("=" * 50)
+import random
+
+
+def print_banner():
+    """Lesson title."""
+    print("🐍 Week 2: Control Flow and Functions")
+    print("=" * 50)
+
 
 # ==============================================
 # 1. CONDITIONAL STATEMENTS (if, elif, else)
 # ==============================================
 
-print("\n🔀 CONDITIONAL STATEMENTS")
-print("-" * 30)
-
-# Basic if statement
-age = 20 
-if age >= 18:
-    print(f"Age {age}: You are an adult!")
-else:
-    print("Still")
-# if-else statement
-temperature = 25
-if temperature > 30:
-    print("It's hot outside! 🌞")
-else:
-    print("It's comfortable or cool outside. 😊")
-
-# if-elif-else chain
-score = 85
-print(f"\nGrade for score {score}:")
-if score >= 90:
-    grade = "A"
-    print("Excellent work! 🌟")
-elif score >= 80:
-    grade = "B"
-    print("Good job! 👍")
-elif score >= 70:
-    grade = "C"
-    print("You passed! ✅")
-elif score >= 60:
-    grade = "D"
-    print("You need to improve. 📚")
-else:
-    grade = "F"
-    print("Please study harder. 💪")
-
-print(f"Your grade is: {grade}")
-
-# Multiple conditions
-username = "admin"
-password = "secret123"
-
-if username == "admin" and password == "secret123":
-    print("Welcome, Administrator!")
-elif username == "admin" and password != "secret123":
-    print("Wrong password!")
-elif username != "admin":
-    print("User not found!")
-
-# Nested conditions
-weather = "sunny"
-have_umbrella = True # Boolean
-
-if weather == "rainy":
-    if have_umbrella:
-        print("You're prepared for the rain! ☂️")
+def demo_conditionals():
+    """Section 1: if, elif and else."""
+    print("\n🔀 CONDITIONAL STATEMENTS")
+    print("-" * 30)
+
+    # Basic if statement
+    age = 20 
+    if age >= 18:
+        print(f"Age {age}: You are an adult!")
+    else:
+        print("Still")
+    # if-else statement
+    temperature = 25
+    if temperature > 30:
+        print("It's hot outside! 🌞")
+    else:
+        print("It's comfortable or cool outside. 😊")
+
+    # if-elif-else chain
+    score = 85
+    print(f"\nGrade for score {score}:")
+    if score >= 90:
+        grade = "A"
+        print("Excellent work! 🌟")
+    elif score >= 80:
+        grade = "B"
+        print("Good job! 👍")
+    elif score >= 70:
+        grade = "C"
+        print("You passed! ✅")
+    elif score >= 60:
+        grade = "D"
+        print("You need to improve. 📚")
+    else:
+        grade = "F"
+        print("Please study harder. 💪")
+
+    print(f"Your grade is: {grade}")
+
+    # Multiple conditions
+    username = "admin"
+    password = "secret123"
+
+    if username == "admin" and password == "secret123":
+        print("Welcome, Administrator!")
+    elif username == "admin" and password != "secret123":
+        print("Wrong password!")
+    elif username != "admin":
+        print("User not found!")
+
+    # Nested conditions
+    weather = "sunny"
+    have_umbrella = True # Boolean
+
+    if weather == "rainy":
+        if have_umbrella:
+            print("You're prepared for the rain! ☂️")
+        else:
+            print("You might get wet! 🌧️")
     else:
-        print("You might get wet! 🌧️")
-else:
-    print("Enjoy the nice weather! ☀️")
+        print("Enjoy the nice weather! ☀️")
+
 
 # ==============================================
 # 2. LOOPS - FOR LOOPS
 # ==============================================
 
-print("\n🔄 FOR LOOPS")
-print("-" * 15)
-
-# Basic for loop with range
-print("Counting from 1 to 5:")
-for i in range(1, 6):
-    print(f"Count: {i}")
-
-# List
-# Dictionaries 
-person = {
-    "name": "Tadiwa", "age": "18"
-}
-person[age]
-person[1]
-# Sets
-
-# Loop through a list
-fruits = ["apple", "banana", "orange", "grape"]
-print(f"\nFruits in the basket:")
-for fruit in fruits:
-    print(f"- {fruit}")
-
-# Loop with index using enumerate
-print(f"\nFruits with index:")
-for index, fruit in enumerate(fruits):
-    print(f"{index + 1}. {fruit}")
-
-# Loop through a dictionary
-student_grades = {
-    "Alice": 92,
-    "Bob": 78,
-    "Charlie": 85,
-    "Diana": 96
-}
-
-print(f"\nStudent grades:")
-for name, grade in student_grades.items():
-    print(f"{name}: {grade}")
-
-# Nested loops - multiplication table
-print(f"\nMultiplication table (3x3):")
-for i in range(1, 4):
-    for j in range(1, 4):
-        result = i * j
-        print(f"{i} x {j} = {result:2d}", end="  ")
-    print()  # New line after each row
+def demo_for_loops():
+    """Section 2: for loops."""
+    print("\n🔄 FOR LOOPS")
+    print("-" * 15)
+
+    # Basic for loop with range
+    print("Counting from 1 to 5:")
+    for i in range(1, 6):
+        print(f"Count: {i}")
+
+    # List
+    # Dictionaries 
+    person = {
+        "name": "Tadiwa", "age": "18"
+    }
+    print(f"Person: {person['name']}, age {person['age']}")
+    # Sets
+
+    # Loop through a list
+    fruits = ["apple", "banana", "orange", "grape"]
+    print(f"\nFruits in the basket:")
+    for fruit in fruits:
+        print(f"- {fruit}")
+
+    # Loop with index using enumerate
+    print(f"\nFruits with index:")
+    for index, fruit in enumerate(fruits):
+        print(f"{index + 1}. {fruit}")
+
+    # Loop through a dictionary
+    student_grades = {
+        "Alice": 92,
+        "Bob": 78,
+        "Charlie": 85,
+        "Diana": 96
+    }
+
+    print(f"\nStudent grades:")
+    for name, grade in student_grades.items():
+        print(f"{name}: {grade}")
+
+    # Nested loops - multiplication table
+    print(f"\nMultiplication table (3x3):")
+    for i in range(1, 4):
+        for j in range(1, 4):
+            result = i * j
+            print(f"{i} x {j} = {result:2d}", end="  ")
+        print()  # New line after each row
+
 
 # ==============================================
 # 3. LOOPS - WHILE LOOPS
 # ==============================================
 
-print("\n🔁 WHILE LOOPS")
-print("-" * 16)
-
-# Basic while loop
-print("Countdown:")
-count = 5
-while count > 0:
-    print(f"{count}...")
-    count -= 1
-print("Blast off! 🚀")
-
-# While loop with user input simulation
-print(f"\nPassword attempt simulation:")
-attempts = 0
-max_attempts = 3
-correct_password = "python123"
-
-# Simulating user attempts (in real program, use input())
-user_attempts = ["wrong1", "wrong2", "python123"]
-
-while attempts < max_attempts:
-    # In real program: password = input("Enter password: ")
-    password = user_attempts[attempts] if attempts < len(user_attempts) else "wrong"
-    attempts += 1
-    
-    if password == correct_password:
-        print("Access granted! ✅")
-        break
-    else:
-        remaining = max_attempts - attempts
-        if remaining > 0:
-            print(f"Wrong password. {remaining} attempts remaining.")
+def demo_while_loops():
+    """Section 3: while loops."""
+    print("\n🔁 WHILE LOOPS")
+    print("-" * 16)
+
+    # Basic while loop
+    print("Countdown:")
+    count = 5
+    while count > 0:
+        print(f"{count}...")
+        count -= 1
+    print("Blast off! 🚀")
+
+    # While loop with user input simulation
+    print(f"\nPassword attempt simulation:")
+    attempts = 0
+    max_attempts = 3
+    correct_password = "python123"
+
+    # Simulating user attempts (in real program, use input())
+    user_attempts = ["wrong1", "wrong2", "python123"]
+
+    while attempts < max_attempts:
+        # In real program: password = input("Enter password: ")
+        password = user_attempts[attempts] if attempts < len(user_attempts) else "wrong"
+        attempts += 1
+
+        if password == correct_password:
+            print("Access granted! ✅")
+            break
         else:
-            print("Account locked! ❌")
+            remaining = max_attempts - attempts
+            if remaining > 0:
+                print(f"Wrong password. {remaining} attempts remaining.")
+            else:
+                print("Account locked! ❌")
+
 
 # ==============================================
 # 4. LOOP CONTROL (break, continue)
 # ==============================================
 
-print("\n⏸️ LOOP CONTROL: break and continue")
-print("-" * 40)
-
-# Using 'continue' to skip iterations
-print("Even numbers from 1 to 10:")
-for num in range(1, 11):
-    if num % 2 != 0:  # If odd number
-        continue      # Skip to next iteration
-    print(f"{num} is even")
-
-# Using 'break' to exit early
-print(f"\nFinding first number divisible by 7:")
-for num in range(1, 100):
-    if num % 7 == 0:
-        print(f"Found it: {num}")
-        break
-    print(f"Checking {num}...")
-
-# Combining break and continue
-print(f"\nProcessing numbers 1-20 (skip multiples of 3, stop at first multiple of 13):")
-for num in range(1, 21):
-    if num % 13 == 0:
-        print(f"Found multiple of 13: {num}. Stopping!")
-        break
-    if num % 3 == 0:
-        print(f"Skipping {num} (multiple of 3)")
-        continue
-    print(f"Processing {num}")
+def demo_loop_control():
+    """Section 4: break and continue."""
+    print("\n⏸️ LOOP CONTROL: break and continue")
+    print("-" * 40)
+
+    # Using 'continue' to skip iterations
+    print("Even numbers from 1 to 10:")
+    for num in range(1, 11):
+        if num % 2 != 0:  # If odd number
+            continue      # Skip to next iteration
+        print(f"{num} is even")
+
+    # Using 'break' to exit early
+    print(f"\nFinding first number divisible by 7:")
+    for num in range(1, 100):
+        if num % 7 == 0:
+            print(f"Found it: {num}")
+            break
+        print(f"Checking {num}...")
+
+    # Combining break and continue
+    print(f"\nProcessing numbers 1-20 (skip multiples of 3, stop at first multiple of 13):")
+    for num in range(1, 21):
+        if num % 13 == 0:
+            print(f"Found multiple of 13: {num}. Stopping!")
+            break
+        if num % 3 == 0:
+            print(f"Skipping {num} (multiple of 3)")
+            continue
+        print(f"Processing {num}")
+
 
 # ==============================================
 # 5. FUNCTIONS - DEFINITION, PARAMETERS, RETURN VALUES
 # ==============================================
 
-print("\n🔧 FUNCTIONS")
-print("-" * 12)
-
 # Simple function with no parameters
 def greet():
     """A simple greeting function"""
     return "Hello, Welcome to Python!"
 
-print("Simple function:")
-message = greet()
-print(message)
 
 # Function with parameters
 def greet_person(name, age):
     """Greet a person with their name and age"""
     return f"Hello {name}! You are {age} years old."
 
-print(f"\nFunction with parameters:")
-greeting = greet_person("Alice", 25)
-print(greeting)
 
 # Function with default parameters
 def introduce(name, age, city="Unknown"):
     """Introduction with default city"""
     return f"Hi, I'm {name}, {age} years old, from {city}."
 
-print(f"\nFunction with default parameters:")
-print(introduce("Bob", 30))
-print(introduce("Charlie", 28, "New York"))
 
 # Function with multiple return values
 def calculate_rectangle(length, width):
@@ -244,9 +249,6 @@ def calculate_rectangle(length, width):
     perimeter = 2 * (length + width)
     return area, perimeter
 
-print(f"\nFunction with multiple return values:")
-rect_area, rect_perimeter = calculate_rectangle(5, 3)
-print(f"Rectangle (5x3): Area = {rect_area}, Perimeter = {rect_perimeter}")
 
 # Function with variable arguments
 def calculate_average(*numbers):
@@ -255,11 +257,6 @@ def calculate_average(*numbers):
         return 0
     return sum(numbers) / len(numbers)
 
-print(f"\nFunction with variable arguments:")
-avg1 = calculate_average(10, 20, 30)
-avg2 = calculate_average(5, 15, 25, 35, 45)
-print(f"Average of (10,20,30): {avg1}")
-print(f"Average of (5,15,25,35,45): {avg2}")
 
 # Function with keyword arguments
 def create_profile(**info):
@@ -269,20 +266,47 @@ def create_profile(**info):
         profile += f"  {key.title()}: {value}\n"
     return profile
 
-print(f"\nFunction with keyword arguments:")
-profile = create_profile(name="John", age=30, city="Boston", hobby="reading")
-print(profile)
+
+def demo_functions():
+    """Section 5: defining and calling functions."""
+    print("\n🔧 FUNCTIONS")
+    print("-" * 12)
+
+    print("Simple function:")
+    message = greet()
+    print(message)
+
+    print(f"\nFunction with parameters:")
+    greeting = greet_person("Alice", 25)
+    print(greeting)
+
+    print(f"\nFunction with default parameters:")
+    print(introduce("Bob", 30))
+    print(introduce("Charlie", 28, "New York"))
+
+    print(f"\nFunction with multiple return values:")
+    rect_area, rect_perimeter = calculate_rectangle(5, 3)
+    print(f"Rectangle (5x3): Area = {rect_area}, Perimeter = {rect_perimeter}")
+
+    print(f"\nFunction with variable arguments:")
+    avg1 = calculate_average(10, 20, 30)
+    avg2 = calculate_average(5, 15, 25, 35, 45)
+    print(f"Average of (10,20,30): {avg1}")
+    print(f"Average of (5,15,25,35,45): {avg2}")
+
+    print(f"\nFunction with keyword arguments:")
+    profile = create_profile(name="John", age=30, city="Boston", hobby="reading")
+    print(profile)
+
 
 # ==============================================
 # 6. VARIABLE SCOPE (local vs global)
 # ==============================================
 
-print("\n🌍 VARIABLE SCOPE")
-print("-" * 18)
-
 # Global variable
 global_counter = 0
 
+
 def demonstrate_scope():
     """Demonstrate local vs global scope"""
     # Local variable
@@ -290,26 +314,24 @@ def demonstrate_scope():
     print(f"Inside function - local_counter: {local_counter}")
     print(f"Inside function - global_counter: {global_counter}")
 
+
 def modify_global():
     """Modify global variable"""
     global global_counter
     global_counter += 1
     print(f"Global counter modified to: {global_counter}")
 
+
 def local_vs_global():
     """Show local variable shadowing global"""
     global_counter = 999  # This creates a local variable!
     print(f"Local global_counter (shadows global): {global_counter}")
 
-print("Scope demonstration:")
-demonstrate_scope()
-modify_global()
-local_vs_global()
-print(f"After all functions, global_counter is: {global_counter}")
 
 # Practical example: Bank account
 account_balance = 1000  # Global variable
 
+
 def deposit(amount):
     """Deposit money to account"""
     global account_balance
@@ -318,6 +340,7 @@ def deposit(amount):
         return f"Deposited ${amount}. New balance: ${account_balance}"
     return "Invalid deposit amount"
 
+
 def withdraw(amount):
     """Withdraw money from account"""
     global account_balance
@@ -326,81 +349,85 @@ def withdraw(amount):
         return f"Withdrew ${amount}. New balance: ${account_balance}"
     return "Invalid withdrawal amount or insufficient funds"
 
+
 def check_balance():
     """Check current balance"""
     return f"Current balance: ${account_balance}"
 
-print(f"\nBank account example:")
-print(check_balance())
-print(deposit(200))
-print(withdraw(150))
-print(check_balance())
+
+def demo_scope():
+    """Section 6: local and global variables."""
+    print("\n🌍 VARIABLE SCOPE")
+    print("-" * 18)
+
+    print("Scope demonstration:")
+    demonstrate_scope()
+    modify_global()
+    local_vs_global()
+    print(f"After all functions, global_counter is: {global_counter}")
+
+    print(f"\nBank account example:")
+    print(check_balance())
+    print(deposit(200))
+    print(withdraw(150))
+    print(check_balance())
+
 
 # ==============================================
 # 7. LAMBDA FUNCTIONS (INTRODUCTION)
 # ==============================================
 
-print("\n⚡ LAMBDA FUNCTIONS")
-print("-" * 19)
+def demo_lambdas():
+    """Section 7: lambda functions."""
+    print("\n⚡ LAMBDA FUNCTIONS")
+    print("-" * 19)
 
-# Basic lambda function
-square = lambda x: x ** 2
-print(f"Lambda to square number:")
-print(f"square(5) = {square(5)}")
+    # Basic lambda function
+    square = lambda x: x ** 2
+    print(f"Lambda to square number:")
+    print(f"square(5) = {square(5)}")
 
-# Lambda with multiple parameters
-add = lambda x, y: x + y
-multiply = lambda x, y, z: x * y * z
+    # Lambda with multiple parameters
+    add = lambda x, y: x + y
+    multiply = lambda x, y, z: x * y * z
 
-print(f"\nLambda with multiple parameters:")
-print(f"add(3, 7) = {add(3, 7)}")
-print(f"multiply(2, 3, 4) = {multiply(2, 3, 4)}")
+    print(f"\nLambda with multiple parameters:")
+    print(f"add(3, 7) = {add(3, 7)}")
+    print(f"multiply(2, 3, 4) = {multiply(2, 3, 4)}")
 
-# Using lambda with built-in functions
-numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    # Using lambda with built-in functions
+    numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 
-# Filter even numbers
-even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
-print(f"\nUsing lambda with filter:")
-print(f"Even numbers: {even_numbers}")
+    # Filter even numbers
+    even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
+    print(f"\nUsing lambda with filter:")
+    print(f"Even numbers: {even_numbers}")
 
-# Map - square all numbers
-squared_numbers = list(map(lambda x: x ** 2, numbers))
-print(f"\nUsing lambda with map:")
-print(f"Squared numbers: {squared_numbers}")
+    # Map - square all numbers
+    squared_numbers = list(map(lambda x: x ** 2, numbers))
+    print(f"\nUsing lambda with map:")
+    print(f"Squared numbers: {squared_numbers}")
 
-# Sort list of tuples by second element
-students = [("Alice", 85), ("Bob", 92), ("Charlie", 78), ("Diana", 96)]
-sorted_by_grade = sorted(students, key=lambda student: student[1])
-print(f"\nUsing lambda with sorted:")
-print(f"Students sorted by grade: {sorted_by_grade}")
+    # Sort list of tuples by second element
+    students = [("Alice", 85), ("Bob", 92), ("Charlie", 78), ("Diana", 96)]
+    sorted_by_grade = sorted(students, key=lambda student: student[1])
+    print(f"\nUsing lambda with sorted:")
+    print(f"Students sorted by grade: {sorted_by_grade}")
 
-# Practical lambda examples
-# Temperature converter
-celsius_to_fahrenheit = lambda c: (c * 9/5) + 32
-fahrenheit_to_celsius = lambda f: (f - 32) * 5/9
+    # Practical lambda examples
+    # Temperature converter
+    celsius_to_fahrenheit = lambda c: (c * 9/5) + 32
+    fahrenheit_to_celsius = lambda f: (f - 32) * 5/9
+
+    print(f"\nTemperature converters:")
+    print(f"25°C = {celsius_to_fahrenheit(25)}°F")
+    print(f"77°F = {fahrenheit_to_celsius(77)}°C")
 
-print(f"\nTemperature converters:")
-print(f"25°C = {celsius_to_fahrenheit(25)}°F")
-print(f"77°F = {fahrenheit_to_celsius(77)}°C")
 
 # ==============================================
 # 8. ERROR HANDLING BASICS (try/except)
 # ==============================================
 
-print("\n🛡️ ERROR HANDLING")
-print("-" * 18)
-
-# Basic try-except
-print("Basic error handling:")
-try:
-    result = 10 / 0
-    print(f"Result: {result}")
-except ZeroDivisionError:
-    print("Error: Cannot divide by zero!")
-
-# Handling multiple exception types
-print(f"\nHandling multiple exception types:")
 def safe_divide(a, b):
     try:
         result = a / b
@@ -410,12 +437,7 @@ def safe_divide(a, b):
     except TypeError:
         return "Error: Please provide numeric values!"
 
-print(safe_divide(10, 2))
-print(safe_divide(10, 0))
-print(safe_divide(10, "abc"))
 
-# try-except-else-finally
-print(f"\nComplete try-except-else-finally:")
 def process_file(filename):
     try:
         # Simulate file operations
@@ -433,10 +455,6 @@ def process_file(filename):
     finally:
         print("Cleaning up resources...")
 
-print("Processing valid file:")
-process_file("valid.txt")
-print("\nProcessing invalid file:")
-process_file("invalid.txt")
 
 # Practical error handling example
 def get_user_age():
@@ -462,15 +480,42 @@ def get_user_age():
         except Exception as e:
             print(f"Unexpected error: {e}")
 
-get_user_age()
+
+def demo_error_handling():
+    """Section 8: try/except."""
+    print("\n🛡️ ERROR HANDLING")
+    print("-" * 18)
+
+    # Basic try-except
+    print("Basic error handling:")
+    try:
+        result = 10 / 0
+        print(f"Result: {result}")
+    except ZeroDivisionError:
+        print("Error: Cannot divide by zero!")
+
+    # Handling multiple exception types
+    print(f"\nHandling multiple exception types:")
+
+    print(safe_divide(10, 2))
+    print(safe_divide(10, 0))
+    print(safe_divide(10, "abc"))
+
+    # try-except-else-finally
+    print(f"\nComplete try-except-else-finally:")
+
+    print("Processing valid file:")
+    process_file("valid.txt")
+    print("\nProcessing invalid file:")
+    process_file("invalid.txt")
+
+    get_user_age()
+
 
 # ==============================================
 # 9. PRACTICAL EXERCISES AND EXAMPLES
 # ==============================================
 
-print("\n\n📝 PRACTICAL EXERCISES")
-print("=" * 25)
-
 # Exercise 1: Grade Calculator with Functions
 def calculate_letter_grade(score):
     """Calculate letter grade from numeric score"""
@@ -492,14 +537,8 @@ def calculate_letter_grade(score):
     except ValueError:
         return "Error: Invalid score format"
 
-print("Exercise 1: Grade Calculator")
-test_scores = [95, 83, 77, 65, 45, "invalid", 105]
-for score in test_scores:
-    grade = calculate_letter_grade(score)
-    print(f"Score {score}: Grade {grade}")
 
 # Exercise 2: Number Guessing Game
-import random
 
 def number_guessing_game():
     """Simple number guessing game"""
@@ -533,7 +572,6 @@ def number_guessing_game():
         remaining = max_attempts - attempts
         print(f"You have {remaining} attempts left.")
 
-number_guessing_game()
 
 # Exercise 3: Text Analyzer with Multiple Functions
 def analyze_text(text):
@@ -570,21 +608,33 @@ def analyze_text(text):
     except Exception as e:
         return {"error": str(e)}
 
-print(f"\nExercise 3: Text Analyzer")
-sample_text = "Hello world! This is a sample text for analysis. How many words and characters are here?"
-analysis = analyze_text(sample_text)
-print(f"Text: '{sample_text}'")
-print("Analysis results:")
-for key, value in analysis.items():
-    print(f"  {key.replace('_', ' ').title()}: {value}")
+
+def demo_exercises():
+    """Section 9: practical exercises."""
+    print("\n\n📝 PRACTICAL EXERCISES")
+    print("=" * 25)
+
+    print("Exercise 1: Grade Calculator")
+    test_scores = [95, 83, 77, 65, 45, "invalid", 105]
+    for score in test_scores:
+        grade = calculate_letter_grade(score)
+        print(f"Score {score}: Grade {grade}")
+
+    number_guessing_game()
+
+    print(f"\nExercise 3: Text Analyzer")
+    sample_text = "Hello world! This is a sample text for analysis. How many words and characters are here?"
+    analysis = analyze_text(sample_text)
+    print(f"Text: '{sample_text}'")
+    print("Analysis results:")
+    for key, value in analysis.items():
+        print(f"  {key.replace('_', ' ').title()}: {value}")
+
 
 # ==============================================
 # 10. HOMEWORK ASSIGNMENTS
 # ==============================================
 
-print(f"\n\n📚 HOMEWORK ASSIGNMENTS")
-print("=" * 26)
-
 homework_problems = """
 HOMEWORK FOR WEEK 2:
 
@@ -627,7 +677,14 @@ HOMEWORK FOR WEEK 2:
    - Keeps history of calculations
 """
 
-print(homework_problems)
+
+def show_homework():
+    """Section 10: homework assignments."""
+    print(f"\n\n📚 HOMEWORK ASSIGNMENTS")
+    print("=" * 26)
+
+    print(homework_problems)
+
 
 # ==============================================
 # SOLUTIONS PREVIEW (for instructors)
@@ -684,11 +741,15 @@ def instructor_solutions():
     fib_nums = fibonacci_iterative(100)
     print(f"Fibonacci numbers: {fib_nums}")
 
-# Uncomment to see instructor solutions
-# instructor_solutions()
 
-print(f"\n🎉 End of Week 2: Control Flow and Functions!")
-print("Keep practicing these concepts - they're the building blocks of programming! 💪")
+def print_closing():
+    """Closing message."""
+    # Uncomment to see instructor solutions
+    # instructor_solutions()
+
+    print(f"\n🎉 End of Week 2: Control Flow and Functions!")
+    print("Keep practicing these concepts - they're the building blocks of programming! 💪")
+
 
 # ==============================================
 # SUMMARY OF KEY CONCEPTS
@@ -730,4 +791,29 @@ summary = """
 🎯 NEXT WEEK: Data Structures (Lists, Dictionaries, Sets)
 """
 
-print(summary)
\ No newline at end of file
+
+def show_summary():
+    """Summary of the week's key concepts."""
+    print(summary)
+
+
+def main():
+    """Run every Week 2 section in order."""
+    print_banner()
+    demo_conditionals()
+    demo_for_loops()
+    demo_while_loops()
+    demo_loop_control()
+    demo_functions()
+    demo_scope()
+    demo_lambdas()
+    demo_error_handling()
+    demo_exercises()
+    show_homework()
+    print_closing()
+    show_summary()
+
+
+# Run the lesson only when the file is executed directly, not on import
+if __name__ == "__main__":
+    main()
@@ -21,113 +21,126 @@ Topics included:
 - Exercises and homework
 """
 
-print("🐍 Week 3: Data Structures & Object-Oriented Programming")
-print("=" * 70)
+from collections import namedtuple, deque, Counter
+from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+
+
+def print_banner():
+    """Lesson title."""
+    print("🐍 Week 3: Data Structures & Object-Oriented Programming")
+    print("=" * 70)
+
 
 # ==============================================
 # PART A - SMALL DATA STRUCTURES
 # ==============================================
 
-print("\n📦 PART A — Small Data Structures")
-print("-" * 40)
-
-# LISTS
-print("\n1) LISTS — ordered, mutable")
-fruits = ["apple", "banana", "orange"]
-print("List:", fruits)
-
-# common operations
-fruits.append("grape")
-print("After append:", fruits)
-fruits.insert(1, "mango")
-print("After insert:", fruits)
-print("Pop last:", fruits.pop())
-print("Index of 'banana':", fruits.index("banana"))
-print("Slice first two:", fruits[:2])
-
-# List comprehensions
-numbers = [1, 2, 3, 4, 5]
-squares = [x * x for x in numbers]
-print("Squares:", squares)
-
-# TUPLES
-print("\n2) TUPLES — ordered, immutable")
-point = (10, 20)
-x, y = point  # tuple unpacking
-print("Point:", point, "x:", x, "y:", y)
-
-# DICTIONARIES
-print("\n3) DICTIONARIES — mapping of keys -> values")
-student = {"name": "Alice", "age": 22, "grades": [85, 90, 78]}
-print("Student:", student)
-print("Access name:", student["name"])  # KeyError if missing
-print("Get with default:", student.get("email", "no-email@example.com"))
-
-# iterate
-for key, value in student.items():
-    print(f"  {key} -> {value}")
-
-# modify
-student["city"] = "Nairobi"
-print("After adding city:", student)
-
-# SETS
-print("\n4) SETS — unordered, unique elements")
-colors = {"red", "green", "blue"}
-colors.add("yellow")
-print("Colors set:", colors)
-print("Is 'red' present?", "red" in colors)
-
-# set operations
-a = {1, 2, 3}
-b = {3, 4, 5}
-print("Union:", a | b)
-print("Intersection:", a & b)
-print("Difference (a-b):", a - b)
-
-# NAMEDTUPLE and deque, Counter
-print("\n5) namedtuple, deque, Counter (collections module)")
-from collections import namedtuple, deque, Counter
-
 Point = namedtuple('Point', ['x', 'y'])
-p = Point(3, 4)
-print("Namedtuple Point:", p, "x:", p.x)
-
-# deque — fast append/pop from both ends
-dq = deque([1, 2, 3])
-dq.appendleft(0)
-dq.append(4)
-print("Deque:", dq)
-
-# Counter — frequency counts
-words = ['apple', 'banana', 'apple', 'orange', 'banana', 'apple']
-ctr = Counter(words)
-print("Counter:", ctr)
-print("Most common:", ctr.most_common(2))
-
-# WHEN TO CHOOSE WHICH
-print("\nWhen to choose:")
-print("- Use list for ordered collections and frequent indexing")
-print("- Use tuple for fixed records or keys")
-print("- Use dict for lookups by key")
-print("- Use set for membership tests and removing duplicates")
-print("- Use deque for queue-like operations")
-
-# Complexity hints (very brief)
-print("\nComplexity hints:")
-print("- list append: O(1) amortized; insert/pop at middle: O(n)")
-print("- dict/set average lookup: O(1)")
-print("- tuple: like list but immutable")
+
+
+def demo_small_data_structures():
+    """Part A: lists, tuples, dicts, sets and collections."""
+    print("\n📦 PART A — Small Data Structures")
+    print("-" * 40)
+
+    # LISTS
+    print("\n1) LISTS — ordered, mutable")
+    fruits = ["apple", "banana", "orange"]
+    print("List:", fruits)
+
+    # common operations
+    fruits.append("grape")
+    print("After append:", fruits)
+    fruits.insert(1, "mango")
+    print("After insert:", fruits)
+    print("Pop last:", fruits.pop())
+    print("Index of 'banana':", fruits.index("banana"))
+    print("Slice first two:", fruits[:2])
+
+    # List comprehensions
+    numbers = [1, 2, 3, 4, 5]
+    squares = [x * x for x in numbers]
+    print("Squares:", squares)
+
+    # TUPLES
+    print("\n2) TUPLES — ordered, immutable")
+    point = (10, 20)
+    x, y = point  # tuple unpacking
+    print("Point:", point, "x:", x, "y:", y)
+
+    # DICTIONARIES
+    print("\n3) DICTIONARIES — mapping of keys -> values")
+    student = {"name": "Alice", "age": 22, "grades": [85, 90, 78]}
+    print("Student:", student)
+    print("Access name:", student["name"])  # KeyError if missing
+    print("Get with default:", student.get("email", "no-email@example.com"))
+
+    # iterate
+    for key, value in student.items():
+        print(f"  {key} -> {value}")
+
+    # modify
+    student["city"] = "Nairobi"
+    print("After adding city:", student)
+
+    # SETS
+    print("\n4) SETS — unordered, unique elements")
+    colors = {"red", "green", "blue"}
+    colors.add("yellow")
+    print("Colors set:", colors)
+    print("Is 'red' present?", "red" in colors)
+
+    # set operations
+    a = {1, 2, 3}
+    b = {3, 4, 5}
+    print("Union:", a | b)
+    print("Intersection:", a & b)
+    print("Difference (a-b):", a - b)
+
+    # NAMEDTUPLE and deque, Counter
+    print("\n5) namedtuple, deque, Counter (collections module)")
+    p = Point(3, 4)
+    print("Namedtuple Point:", p, "x:", p.x)
+
+    # deque — fast append/pop from both ends
+    dq = deque([1, 2, 3])
+    dq.appendleft(0)
+    dq.append(4)
+    print("Deque:", dq)
+
+    # Counter — frequency counts
+    words = ['apple', 'banana', 'apple', 'orange', 'banana', 'apple']
+    ctr = Counter(words)
+    print("Counter:", ctr)
+    print("Most common:", ctr.most_common(2))
+
+    # WHEN TO CHOOSE WHICH
+    print("\nWhen to choose:")
+    print("- Use list for ordered collections and frequent indexing")
+    print("- Use tuple for fixed records or keys")
+    print("- Use dict for lookups by key")
+    print("- Use set for membership tests and removing duplicates")
+    print("- Use deque for queue-like operations")
+
+    # Complexity hints (very brief)
+    print("\nComplexity hints:")
+    print("- list append: O(1) amortized; insert/pop at middle: O(n)")
+    print("- dict/set average lookup: O(1)")
+    print("- tuple: like list but immutable")
+
 
 # ==============================================
 # PART B - OBJECT-ORIENTED PROGRAMMING (OOP)
 # ==============================================
 
-print("\n\n🏗️ PART B — Object-Oriented Programming (OOP)")
-print("-" * 40)
+def print_part_b_banner():
+    """Part B title."""
+    print("\n\n🏗️ PART B — Object-Oriented Programming (OOP)")
+    print("-" * 40)
+
 
 # Basic class example
-print("\n1) Basic class definition and instance")
 
 class Person:
     """Simple Person class"""
@@ -144,13 +157,18 @@ class Person:
         self.age += 1
         return self.age
 
-p = Person("John", 30)
-print(p.greet())
-print("Species:", Person.species)
-print("After birthday, age:", p.have_birthday())
+
+def demo_basic_class():
+    """Part B 1: a basic class and its instances."""
+    print("\n1) Basic class definition and instance")
+
+    p = Person("John", 30)
+    print(p.greet())
+    print("Species:", Person.species)
+    print("After birthday, age:", p.have_birthday())
+
 
 # Encapsulation (convention)
-print("\n2) Encapsulation - public vs 'protected' vs 'private' (convention)")
 
 class BankAccount:
     def __init__(self, owner: str, balance: float = 0.0):
@@ -177,17 +195,22 @@ class BankAccount:
     def get_balance(self):
         return self.__balance
 
-acct = BankAccount("Alice", 100.0)
-print("Balance:", acct.get_balance())
-acct.deposit(50)
-print("After deposit:", acct.get_balance())
-try:
-    acct.withdraw(500)
-except ValueError as e:
-    print("Withdraw error:", e)
+
+def demo_encapsulation():
+    """Part B 2: public, protected and private attributes."""
+    print("\n2) Encapsulation - public vs 'protected' vs 'private' (convention)")
+
+    acct = BankAccount("Alice", 100.0)
+    print("Balance:", acct.get_balance())
+    acct.deposit(50)
+    print("After deposit:", acct.get_balance())
+    try:
+        acct.withdraw(500)
+    except ValueError as e:
+        print("Withdraw error:", e)
+
 
 # Class, Static methods, and Properties
-print("\n3) classmethod, staticmethod, and @property")
 
 class Circle:
     PI = 3.14159
@@ -207,14 +230,19 @@ class Circle:
     def is_radius_valid(value):
         return value > 0
 
-c = Circle(3)
-print("Circle radius:", c.radius)
-print("Circle area:", c.area)
-print("Create from diameter:", Circle.from_diameter(10).radius)
-print("Is radius valid?", Circle.is_radius_valid(-1))
+
+def demo_class_static_methods():
+    """Part B 3: classmethod, staticmethod and @property."""
+    print("\n3) classmethod, staticmethod, and @property")
+
+    c = Circle(3)
+    print("Circle radius:", c.radius)
+    print("Circle area:", c.area)
+    print("Create from diameter:", Circle.from_diameter(10).radius)
+    print("Is radius valid?", Circle.is_radius_valid(-1))
+
 
 # Inheritance and Polymorphism
-print("\n4) Inheritance and Polymorphism")
 
 class Animal:
     def __init__(self, name):
@@ -223,20 +251,27 @@ class Animal:
     def speak(self):
         raise NotImplementedError("Subclasses must implement speak")
 
+
 class Dog(Animal):
     def speak(self):
         return f"{self.name} says Woof!"
 
+
 class Cat(Animal):
     def speak(self):
         return f"{self.name} says Meow!"
 
-animals = [Dog("Rex"), Cat("Mittens")]
-for a in animals:
-    print(a.speak())  # polymorphic call
+
+def demo_inheritance():
+    """Part B 4: inheritance and polymorphism."""
+    print("\n4) Inheritance and Polymorphism")
+
+    animals = [Dog("Rex"), Cat("Mittens")]
+    for a in animals:
+        print(a.speak())  # polymorphic call
+
 
 # Magic methods (dunder methods)
-print("\n5) Magic methods: __repr__, __str__, __eq__, ordering")
 
 class Student:
     def __init__(self, name, grade):
@@ -254,14 +289,19 @@ class Student:
             return NotImplemented
         return self.name == other.name and self.grade == other.grade
 
-s1 = Student("Alice", 90)
-s2 = Student("Alice", 90)
-print(repr(s1))
-print(str(s1))
-print("s1 == s2?", s1 == s2)
+
+def demo_magic_methods():
+    """Part B 5: __repr__, __str__ and __eq__."""
+    print("\n5) Magic methods: __repr__, __str__, __eq__, ordering")
+
+    s1 = Student("Alice", 90)
+    s2 = Student("Alice", 90)
+    print(repr(s1))
+    print(str(s1))
+    print("s1 == s2?", s1 == s2)
+
 
 # Comparison
-print("\n6) Ordering with dunder methods (example: __lt__)")
 
 class Box:
     def __init__(self, volume):
@@ -270,29 +310,39 @@ class Box:
     def __lt__(self, other):
         return self.volume < other.volume
 
-boxes = [Box(10), Box(5), Box(20)]
-boxes_sorted = sorted(boxes)
-print("Sorted volumes:", [b.volume for b in boxes_sorted])
+
+def demo_ordering():
+    """Part B 6: ordering with __lt__."""
+    print("\n6) Ordering with dunder methods (example: __lt__)")
+
+    boxes = [Box(10), Box(5), Box(20)]
+    boxes_sorted = sorted(boxes)
+    print("Sorted volumes:", [b.volume for b in boxes_sorted])
+
 
 # Composition vs Inheritance
-print("\n7) Composition vs Inheritance")
 
 class Engine:
     def __init__(self, horsepower):
         self.horsepower = horsepower
 
+
 class Car:
     def __init__(self, model, engine: Engine):
         self.model = model
         self.engine = engine
 
-eng = Engine(150)
-car = Car("Sedan", eng)
-print(f"Car {car.model} with engine {car.engine.horsepower} HP")
+
+def demo_composition():
+    """Part B 7: composition vs inheritance."""
+    print("\n7) Composition vs Inheritance")
+
+    eng = Engine(150)
+    car = Car("Sedan", eng)
+    print(f"Car {car.model} with engine {car.engine.horsepower} HP")
+
 
 # dataclasses (Python 3.7+)
-print("\n8) dataclasses - easy boilerplate for classes")
-from dataclasses import dataclass, field
 
 @dataclass
 class Product:
@@ -301,21 +351,26 @@ class Product:
     price: float = 0.0
     tags: list = field(default_factory=list)
 
-p = Product(1, "Laptop", 1299.99, ["electronics", "computers"]) 
-print(p)
 
-# Simple serialization (to dict)
-print("Product to dict:", p.__dict__)
+def demo_dataclasses():
+    """Part B 8: dataclasses."""
+    print("\n8) dataclasses - easy boilerplate for classes")
+
+    p = Product(1, "Laptop", 1299.99, ["electronics", "computers"]) 
+    print(p)
+
+    # Simple serialization (to dict)
+    print("Product to dict:", p.__dict__)
+
 
 # Abstract Base Classes (ABC)
-print("\n9) Abstract Base Classes (interface-like behavior)")
-from abc import ABC, abstractmethod
 
 class Shape(ABC):
     @abstractmethod
     def area(self):
         pass
 
+
 class Rectangle(Shape):
     def __init__(self, w, h):
         self.w = w
@@ -324,39 +379,52 @@ class Rectangle(Shape):
     def area(self):
         return self.w * self.h
 
-rect = Rectangle(3, 4)
-print("Rectangle area:", rect.area())
+
+def demo_abstract_base_classes():
+    """Part B 9: abstract base classes."""
+    print("\n9) Abstract Base Classes (interface-like behavior)")
+
+    rect = Rectangle(3, 4)
+    print("Rectangle area:", rect.area())
+
 
 # Best practices and SOLID (brief)
-print("\n10) OOP Best Practices (short list)")
-print("- Single Responsibility Principle: one class, one responsibility")
-print("- Use composition over inheritance when appropriate")
-print("- Keep methods small and focused")
-print("- Prefer clear public APIs, hide internal details")
-print("- Add unit tests for critical logic")
+
+def show_best_practices():
+    """Part B 10: OOP best practices."""
+    print("\n10) OOP Best Practices (short list)")
+    print("- Single Responsibility Principle: one class, one responsibility")
+    print("- Use composition over inheritance when appropriate")
+    print("- Keep methods small and focused")
+    print("- Prefer clear public APIs, hide internal details")
+    print("- Add unit tests for critical logic")
+
 
 # ==============================================
 # EXERCISES
 # ==============================================
 
-print("\n\n🧩 EXERCISES — try these in class or as homework")
-print("-" * 50)
+def show_exercises():
+    """Exercises."""
+    print("\n\n🧩 EXERCISES — try these in class or as homework")
+    print("-" * 50)
+
+    exercises = [
+        "1. Create a 'Book' dataclass with title, author, year, and methods to age the book.",
+        "2. Implement a 'Library' class that uses a list/dict to store books and supports add/remove/search.",
+        "3. Build an 'Employee' class with subclasses Manager and Developer - each with a 'work' method.",
+        "4. Implement a simple in-memory 'TaskManager' using OOP and dictionaries to map users to tasks.",
+        "5. Create a 'Vector' class supporting +, -, scalar multiply, and magnitude (use dunder methods)."
+    ]
 
-exercises = [
-    "1. Create a 'Book' dataclass with title, author, year, and methods to age the book.",
-    "2. Implement a 'Library' class that uses a list/dict to store books and supports add/remove/search.",
-    "3. Build an 'Employee' class with subclasses Manager and Developer - each with a 'work' method.",
-    "4. Implement a simple in-memory 'TaskManager' using OOP and dictionaries to map users to tasks.",
-    "5. Create a 'Vector' class supporting +, -, scalar multiply, and magnitude (use dunder methods)."
-]
+    for e in exercises:
+        print(e)
 
-for e in exercises:
-    print(e)
+    # Challenge: combine data structures & OOP
+    print("\nChallenge: Build a small contact manager app:")
+    print("- Use a Contact class and a Manager class to store contacts in a dict by unique ID")
+    print("- Support add, update, delete, search by name, and export to CSV")
 
-# Challenge: combine data structures & OOP
-print("\nChallenge: Build a small contact manager app:")
-print("- Use a Contact class and a Manager class to store contacts in a dict by unique ID")
-print("- Support add, update, delete, search by name, and export to CSV")
 
 # ==============================================
 # HOMEWORK
@@ -376,7 +444,34 @@ Deliverables:
 - At least one unit test file using unittest or pytest
 """
 
-print(homework)
 
-print("\n✅ End of Week 3: Data Structures & OOP - Good luck teaching!")
-print("Keep students coding and encourage explaining their design choices.")
+def show_homework():
+    """Homework and closing message."""
+    print(homework)
+
+    print("\n✅ End of Week 3: Data Structures & OOP - Good luck teaching!")
+    print("Keep students coding and encourage explaining their design choices.")
+
+
+def main():
+    """Run every Week 3 section in order."""
+    print_banner()
+    demo_small_data_structures()
+    print_part_b_banner()
+    demo_basic_class()
+    demo_encapsulation()
+    demo_class_static_methods()
+    demo_inheritance()
+    demo_magic_methods()
+    demo_ordering()
+    demo_composition()
+    demo_dataclasses()
+    demo_abstract_base_classes()
+    show_best_practices()
+    show_exercises()
+    show_homework()
+
+
+# Run the lesson only when the file is executed directly, not on import
+if __name__ == "__main__":
+    main()